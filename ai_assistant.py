@@ -3,35 +3,133 @@ AI Assistant for Battleship Trash Talk
 Uses Ollama for local, free AI responses
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import queue
 import random
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+
+# (connect, read) timeouts in seconds: Ollama runs locally, so a slow
+# connect means it isn't running and we fall back instead of stalling
+CONNECT_TIMEOUT = 0.5
+PROBE_TIMEOUT = (CONNECT_TIMEOUT, 2.0)
+GENERATE_TIMEOUT = (CONNECT_TIMEOUT, 8.0)
+WARMUP_TIMEOUT = (CONNECT_TIMEOUT, 30.0)
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Get the HTTP session shared by all Ollama requests.
+    
+    One keep-alive connection pool for the whole process, retrying
+    transient connection errors and 502/503/504 responses with backoff.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            retry = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                          allowed_methods=["GET", "POST"])
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+            _http_session = requests.Session()
+            _http_session.mount("http://", adapter)
+            _http_session.mount("https://", adapter)
+        return _http_session
 
 
 class BattleshipAI_Assistant:
     """AI assistant that provides trash talk during Battleship games."""
     
-    def __init__(self, ollama_url="http://localhost:11434"):
+    FALLBACK_RESPONSES = [
+        "🤖 AI offline, but I'm still watching you... 👀",
+        "My circuits are tingling with anticipation!",
+        "Calculating optimal trash talk... ERROR 404",
+        "beep boop I am a robot 🤖",
+        "AI.exe has stopped working (but the game continues!)"
+    ]
+    
+    def __init__(self, ollama_url="http://localhost:11434", max_workers=2):
         """
         Initialize AI assistant.
         
         Args:
             ollama_url: URL where Ollama is running (default: localhost:11434)
+            max_workers: Number of background workers for submit() (game events
+                         that arrive together are generated concurrently)
         """
         self.ollama_url = ollama_url
         self.model = "llama3.2:latest"  # Fast, lightweight model
         self.conversation_history = []
+        self.keep_alive = "30m"  # How long Ollama keeps the model loaded between calls
+        self.warmup_interval = 20 * 60  # Seconds between keep-alive pings
         self.personality = """You are a hilarious, sarcastic commentator watching a Battleship game.
 You love to trash-talk both players equally, make fun of their misses, celebrate their hits,
 and provide running commentary. Keep responses SHORT (1-2 sentences max). Be funny, cheeky, 
 and entertaining. Use emojis occasionally. Don't be mean - keep it playful."""
+        
+        # Reuse one keep-alive connection pool for all Ollama requests
+        self._session = get_http_session()
+        
+        # Cached result of the availability probe: (timestamp, available)
+        self._avail_cache = (0.0, False)
+        self.avail_ttl = 5.0  # Seconds before re-probing Ollama
+        
+        # Background workers for submit(), started on first use
+        self.max_workers = max_workers
+        self._jobs = queue.Queue()
+        self._workers = []
+        
+        # Generated hit/miss/sunk comments, rotated once enough are collected
+        # key -> deque of (response, coordinate)
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self.response_cache_size = 256  # Max number of cached event keys
+        self.responses_per_key = 4  # Responses to collect before reusing them
+        
+        # Load the model in the background (and keep it loaded) so the first
+        # trash talk of a game doesn't pay the model load time
+        self._stop_event = threading.Event()
+        threading.Thread(target=self._warmup_loop, daemon=True).start()
+    
+    def _warmup(self):
+        """Ask Ollama to load the current model and keep it loaded."""
+        try:
+            self._session.post(
+                f"{self.ollama_url}/api/generate",
+                json={"model": self.model, "prompt": "", "keep_alive": self.keep_alive},
+                timeout=WARMUP_TIMEOUT
+            )
+        except:
+            pass
+    
+    def _warmup_loop(self):
+        """Warm up the model now and re-ping it every warmup_interval seconds."""
+        while True:
+            self._warmup()
+            if self._stop_event.wait(self.warmup_interval):
+                break
     
     def is_available(self):
-        """Check if Ollama is running and available."""
+        """Check if Ollama is running and available (cached for avail_ttl seconds)."""
+        checked_at, available = self._avail_cache
+        now = time.monotonic()
+        if now - checked_at < self.avail_ttl:
+            return available
+        
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
-            return response.status_code == 200
+            response = self._session.get(f"{self.ollama_url}/api/tags", timeout=PROBE_TIMEOUT)
+            available = response.status_code == 200
         except:
-            return False
+            available = False
+        
+        self._avail_cache = (now, available)
+        return available
     
     def generate_response(self, prompt, context=None):
         """
@@ -44,51 +142,120 @@ and entertaining. Use emojis occasionally. Don't be mean - keep it playful."""
         Returns:
             AI response string or None if failed
         """
+        return ''.join(self.stream_response(prompt, context)).strip()
+    
+    def stream_response(self, prompt, context=None):
+        """
+        Generate AI response to a prompt, yielding text as the model produces it.
+        
+        Args:
+            prompt: User's message or game event
+            context: Optional game context
+            
+        Yields:
+            Chunks of the response string (a single fallback response if failed)
+        """
         if not self.is_available():
-            return self._get_fallback_response(prompt)
+            yield self._get_fallback_response(prompt)
+            return
         
+        received = False
         try:
-            # Build the full prompt with personality and context
-            full_prompt = f"{self.personality}\n\n"
+            # The personality goes in a fixed system message so Ollama can
+            # reuse the cached prompt prefix instead of reprocessing it
+            user_prompt = ""
             if context:
-                full_prompt += f"Game Context: {context}\n\n"
-            full_prompt += f"Respond to: {prompt}"
+                user_prompt += f"Game Context: {context}\n\n"
+            user_prompt += f"Respond to: {prompt}"
             
             # Call Ollama API
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
+            response = self._session.post(
+                f"{self.ollama_url}/api/chat",
                 json={
                     "model": self.model,
-                    "prompt": full_prompt,
-                    "stream": False,
+                    "messages": [
+                        {"role": "system", "content": self.personality},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "stream": True,
+                    "keep_alive": self.keep_alive,
                     "options": {
                         "temperature": 0.9,  # Higher = more creative
                         "num_predict": 50,   # Keep responses short
                     }
                 },
-                timeout=10
+                timeout=GENERATE_TIMEOUT,
+                stream=True
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            else:
-                return self._get_fallback_response(prompt)
+            with response:
+                if response.status_code != 200:
+                    yield self._get_fallback_response(prompt)
+                    return
+                
+                # One JSON object per line, each with the next piece of the message
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    text = chunk.get("message", {}).get("content", "")
+                    if text:
+                        received = True
+                        yield text
+                    if chunk.get("done"):
+                        break
                 
         except Exception as e:
             print(f"AI Assistant error: {e}")
-            return self._get_fallback_response(prompt)
+            # Don't wait for the TTL before noticing Ollama went away
+            self._avail_cache = (time.monotonic(), False)
+            if not received:
+                yield self._get_fallback_response(prompt)
     
     def _get_fallback_response(self, prompt):
         """Get a fallback response when AI is unavailable."""
-        fallbacks = [
-            "🤖 AI offline, but I'm still watching you... 👀",
-            "My circuits are tingling with anticipation!",
-            "Calculating optimal trash talk... ERROR 404",
-            "beep boop I am a robot 🤖",
-            "AI.exe has stopped working (but the game continues!)"
-        ]
-        return random.choice(fallbacks)
+        return random.choice(self.FALLBACK_RESPONSES)
+    
+    def _cached_response(self, key, prompts, coordinate=None):
+        """
+        Generate a response for a templated game event, reusing earlier ones.
+        
+        The first responses_per_key responses for a key come from Ollama; after
+        that they are rotated without calling the model. A coordinate in a
+        reused response is replaced with the current one.
+        
+        Args:
+            key: Event key, e.g. ("hit", is_player_local, player_name)
+            prompts: Candidate prompts for a new response
+            coordinate: Optional coordinate of this event
+            
+        Returns:
+            Response string
+        """
+        with self._response_cache_lock:
+            responses = self._response_cache.get(key)
+            if responses is not None and len(responses) >= self.responses_per_key:
+                self._response_cache.move_to_end(key)
+                response, cached_coordinate = responses[0]
+                responses.rotate(-1)
+                if coordinate and cached_coordinate:
+                    response = re.sub(rf"\b{re.escape(cached_coordinate)}\b", coordinate, response)
+                return response
+        
+        response = self.generate_response(random.choice(prompts))
+        if not response or response in self.FALLBACK_RESPONSES:
+            return response
+        
+        with self._response_cache_lock:
+            responses = self._response_cache.get(key)
+            if responses is None:
+                responses = deque(maxlen=self.responses_per_key)
+                self._response_cache[key] = responses
+                if len(self._response_cache) > self.response_cache_size:
+                    self._response_cache.popitem(last=False)
+            responses.append((response, coordinate))
+        
+        return response
     
     def comment_on_hit(self, player_name, coordinate, is_player_local=True):
         """Generate trash talk for a hit."""
@@ -104,7 +271,7 @@ and entertaining. Use emojis occasionally. Don't be mean - keep it playful."""
                 f"{player_name} got hit at {coordinate}! Roast their ship placement",
                 f"OUCH! {player_name} takes a hit at {coordinate}! React dramatically"
             ]
-        return self.generate_response(random.choice(prompts))
+        return self._cached_response(("hit", is_player_local, player_name), prompts, coordinate)
     
     def comment_on_miss(self, player_name, coordinate, is_player_local=True):
         """Generate trash talk for a miss."""
@@ -114,7 +281,7 @@ and entertaining. Use emojis occasionally. Don't be mean - keep it playful."""
             f"{player_name} hit water at {coordinate}! React with sarcasm",
             f"MISS at {coordinate}! Give {player_name} some playful grief"
         ]
-        return self.generate_response(random.choice(prompts))
+        return self._cached_response(("miss", player_name), prompts, coordinate)
     
     def comment_on_sunk(self, player_name, ship_name, is_player_local=True):
         """Generate trash talk for sinking a ship."""
@@ -130,7 +297,7 @@ and entertaining. Use emojis occasionally. Don't be mean - keep it playful."""
                 f"Down goes {player_name}'s {ship_name}! React to their pain",
                 f"{player_name} lost their {ship_name}! Make a Titanic joke"
             ]
-        return self.generate_response(random.choice(prompts))
+        return self._cached_response(("sunk", is_player_local, player_name, ship_name), prompts)
     
     def comment_on_victory(self, winner_name, loser_name):
         """Generate trash talk for game end."""
@@ -150,17 +317,62 @@ and entertaining. Use emojis occasionally. Don't be mean - keep it playful."""
         context = f"{player_name} said to you during a Battleship game"
         return self.generate_response(message, context=context)
     
+    def stream_chat_response(self, player_name, message):
+        """Respond to player's /ai command, yielding text as it is generated."""
+        context = f"{player_name} said to you during a Battleship game"
+        return self.stream_response(message, context=context)
+    
     def set_model(self, model_name):
         """Change the Ollama model being used."""
         self.model = model_name
+        threading.Thread(target=self._warmup, daemon=True).start()
     
     def get_available_models(self):
         """Get list of available Ollama models."""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
+            response = self._session.get(f"{self.ollama_url}/api/tags", timeout=PROBE_TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 return [model['name'] for model in data.get('models', [])]
         except:
             pass
         return []
+    
+    def submit(self, func, *args, callback=None):
+        """
+        Run an assistant call on a background worker so the caller never blocks.
+        
+        Args:
+            func: Assistant method to call, e.g. self.comment_on_hit
+            *args: Arguments for func
+            callback: Optional function called with the result
+        """
+        if not self._workers:
+            for _ in range(self.max_workers):
+                worker = threading.Thread(target=self._worker_loop, daemon=True)
+                worker.start()
+                self._workers.append(worker)
+        
+        self._jobs.put((func, args, callback))
+    
+    def _worker_loop(self):
+        """Process queued assistant calls until close() is called."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            
+            func, args, callback = job
+            try:
+                result = func(*args)
+                if callback:
+                    callback(result)
+            except Exception as e:
+                print(f"AI Assistant error: {e}")
+    
+    def close(self):
+        """Stop the background workers (the shared HTTP session stays open)."""
+        self._stop_event.set()
+        for _ in self._workers:
+            self._jobs.put(None)
+        self._workers = []
@@ -3,17 +3,6 @@ ASCII Art Converter - Converts images to ASCII art representation
 """
 import numpy as np
 from PIL import Image
-from rich import print
-from rich.highlighter import Highlighter
-from random import randint
-
-class RainbowHighlighter(Highlighter):
-    def highlight(self, text):
-        for index in range(len(text)):
-            text.stylize(f"color({randint(16, 255)})", index, index + 1)
-
-
-rainbow = RainbowHighlighter()
 
 
 class AsciiConverter:
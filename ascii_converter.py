@@ -2,9 +2,238 @@
 ASCII Art Converter - Converts images to ASCII art with color support
 Enhanced with debugging features
 """
+import cv2
 import numpy as np
 from PIL import Image
+from functools import lru_cache
+import os
 import sys
+import threading
+
+# Frozen (PyInstaller) builds run from a temporary directory that is deleted
+# on exit, so Numba's compiled kernels are cached in the user's home instead
+if getattr(sys, 'frozen', False) and 'NUMBA_CACHE_DIR' not in os.environ:
+    os.environ['NUMBA_CACHE_DIR'] = os.path.join(os.path.expanduser('~'), '.ascii-video-chat', 'numba-cache')
+
+# Numba is optional: it fuses the per-pixel output assembly into one
+# compiled, multi-threaded pass. Without it the pure NumPy path is used.
+try:
+    from numba import config as numba_config, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE and 'NUMBA_THREADING_LAYER_PRIORITY' not in os.environ:
+    # Kernels are compiled and run off the main thread, where a TBB pool would
+    # block interpreter exit. Prefer OpenMP, else workqueue (not safe for
+    # concurrent launches, but each converter's _out_lock serializes them).
+    numba_config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _render_lut_kernel(pixels_idx, color_ids, code_bytes, char_bytes, line_end, out):
+        """
+        Render a frame from brightness lookup tables into a byte buffer.
+        
+        The escape code is only written when the color differs from the
+        previous pixel on the same line.
+        
+        Args:
+            pixels_idx: 2D uint8 array of lookup table indices (brightness)
+            color_ids: Id of the distinct escape code for each brightness
+            code_bytes: (256, code_width) uint8 array of encoded escape codes
+            char_bytes: (256,) uint8 array of the character for each brightness
+            line_end: uint8 array appended to every line (reset code)
+            out: Preallocated uint8 buffer, large enough for a code on every pixel
+            
+        Returns:
+            Number of bytes written to out (lines separated by newlines)
+        """
+        height, width = pixels_idx.shape
+        code_width = code_bytes.shape[1]
+        end_len = len(line_end)
+        
+        # First pass: byte length of every line (+1 for the newline)
+        offsets = np.zeros(height + 1, dtype=np.int64)
+        for y in prange(height):
+            total = width + end_len + 1
+            prev_color = -1
+            for x in range(width):
+                color = color_ids[pixels_idx[y, x]]
+                if color != prev_color:
+                    total += code_width
+                    prev_color = color
+            offsets[y + 1] = total
+        for y in range(height):
+            offsets[y + 1] += offsets[y]
+        
+        # Second pass: every line is written at its own offset in parallel
+        for y in prange(height):
+            pos = offsets[y]
+            prev_color = -1
+            for x in range(width):
+                idx = pixels_idx[y, x]
+                color = color_ids[idx]
+                if color != prev_color:
+                    for i in range(code_width):
+                        out[pos + i] = code_bytes[idx, i]
+                    pos += code_width
+                    prev_color = color
+                out[pos] = char_bytes[idx]
+                pos += 1
+            for i in range(end_len):
+                out[pos + i] = line_end[i]
+            if y < height - 1:
+                out[pos + end_len] = 10  # newline
+        return max(offsets[height] - 1, 0)
+    
+    @njit(cache=True)
+    def _color_code_len(key, palette):
+        """Length of the escape code _write_color_code writes for a color key."""
+        if not palette:
+            return 19
+        return 8 + (1 if key < 10 else 2 if key < 100 else 3)
+    
+    @njit(cache=True)
+    def _write_color_code(out, pos, key, palette):
+        """
+        Write the escape code for a color key at out[pos], returning the end position.
+        
+        Keys are 0xRRGGBB for 24-bit codes (components zero-padded, as in
+        _ansi_for) or a palette number for 256-color codes.
+        """
+        out[pos] = 27        # ESC
+        out[pos + 1] = 91    # [
+        out[pos + 2] = 51    # 3
+        out[pos + 3] = 56    # 8
+        out[pos + 4] = 59    # ;
+        out[pos + 5] = 53 if palette else 50    # 5 or 2
+        out[pos + 6] = 59    # ;
+        pos += 7
+        if palette:
+            if key >= 100:
+                out[pos] = 48 + key // 100
+                pos += 1
+            if key >= 10:
+                out[pos] = 48 + key // 10 % 10
+                pos += 1
+            out[pos] = 48 + key % 10
+            out[pos + 1] = 109   # m
+            return pos + 2
+        for i in range(3):
+            c = (key >> (16 - 8 * i)) & 0xFF
+            out[pos] = 48 + c // 100
+            out[pos + 1] = 48 + c // 10 % 10
+            out[pos + 2] = 48 + c % 10
+            out[pos + 3] = 59 if i < 2 else 109    # ; or m
+            pos += 4
+        return pos
+    
+    @njit(parallel=True, cache=True)
+    def _render_color_kernel(pixels_idx, keys, palette, char_bytes, line_end, out):
+        """
+        Render a frame with a color per pixel (normal and palette256 modes).
+        
+        Like _render_lut_kernel, but the escape codes are generated from
+        per-pixel color keys instead of looked up by brightness.
+        
+        Args:
+            pixels_idx: 2D uint8 array of brightness, selecting the character
+            keys: 2D int32 array of color keys (see _write_color_code)
+            palette: True for 256-color codes, False for 24-bit codes
+            char_bytes: (256,) uint8 array of the character for each brightness
+            line_end: uint8 array appended to every line (reset code)
+            out: Preallocated uint8 buffer, large enough for a code on every pixel
+            
+        Returns:
+            Number of bytes written to out (lines separated by newlines)
+        """
+        height, width = pixels_idx.shape
+        end_len = len(line_end)
+        
+        # First pass: byte length of every line (+1 for the newline)
+        offsets = np.zeros(height + 1, dtype=np.int64)
+        for y in prange(height):
+            total = width + end_len + 1
+            prev_key = -1
+            for x in range(width):
+                key = keys[y, x]
+                if key != prev_key:
+                    total += _color_code_len(key, palette)
+                    prev_key = key
+            offsets[y + 1] = total
+        for y in range(height):
+            offsets[y + 1] += offsets[y]
+        
+        # Second pass: every line is written at its own offset in parallel
+        for y in prange(height):
+            pos = offsets[y]
+            prev_key = -1
+            for x in range(width):
+                key = keys[y, x]
+                if key != prev_key:
+                    pos = _write_color_code(out, pos, key, palette)
+                    prev_key = key
+                out[pos] = char_bytes[pixels_idx[y, x]]
+                pos += 1
+            for i in range(end_len):
+                out[pos + i] = line_end[i]
+            if y < height - 1:
+                out[pos + end_len] = 10  # newline
+        return max(offsets[height] - 1, 0)
+
+
+# Kernel compilation (seconds on a cold cache) runs in the background; frames
+# use the NumPy path until it's done. See prewarm_kernels().
+_kernels_ready = threading.Event()
+_kernel_thread = None
+_kernel_lock = threading.Lock()
+
+
+def _compile_kernels():
+    """Run each kernel once on a 1x1 frame so Numba compiles (or loads) it."""
+    try:
+        # Same argument types as in AsciiConverter._render (frombuffer arrays are read-only)
+        pixels = np.zeros((1, 1), dtype=np.uint8)
+        char_bytes = np.frombuffer(b' ' * 256, dtype=np.uint8)
+        line_end = np.frombuffer(b'\033[0m', dtype=np.uint8)
+        out = np.empty(64, dtype=np.uint8)
+        _render_lut_kernel(pixels, np.zeros(256, dtype=np.int32), np.zeros((256, 19), dtype=np.uint8),
+                           char_bytes, line_end, out)
+        _render_color_kernel(pixels, np.zeros((1, 1), dtype=np.int32), False, char_bytes, line_end, out)
+        _kernels_ready.set()
+    except Exception as e:
+        print(f"[ERROR] Numba kernel compilation failed, using NumPy: {e}", file=sys.stderr)
+
+
+def prewarm_kernels():
+    """
+    Start compiling the Numba kernels in a background thread.
+    
+    Call this early (e.g. during the startup countdown). Safe to call more
+    than once; does nothing without Numba.
+    """
+    global _kernel_thread
+    if not NUMBA_AVAILABLE:
+        return
+    with _kernel_lock:
+        if _kernel_thread is None:
+            _kernel_thread = threading.Thread(target=_compile_kernels, daemon=True)
+            _kernel_thread.start()
+
+
+@lru_cache(maxsize=4096)
+def _ansi_for(r, g, b):
+    """
+    Get the ANSI 24-bit foreground color escape code for an RGB color.
+    Components are zero-padded so every code is exactly 19 characters.
+    """
+    return f'\033[38;2;{r:03d};{g:03d};{b:03d}m'
+
+
+# ANSI 256-color palette foreground codes, indexed by palette number
+PALETTE256_CODES = np.array([f'\033[38;5;{n}m' for n in range(256)], dtype=object)
 
 
 class AsciiConverter:
@@ -21,7 +250,8 @@ class AsciiConverter:
         Args:
             width: Target width in characters
             char_set: "simple" or "detailed" character set
-            color_mode: "rainbow", "bw" (black/white), or "normal" (original colors)
+            color_mode: "rainbow", "bw" (black/white), "normal" (original colors),
+                        "palette256" (original colors in 256-color mode) or a solid color
             debug: Enable debug output
         """
         self.width = width
@@ -35,6 +265,26 @@ class AsciiConverter:
             
         self.char_count = len(self.chars)
         
+        # Character for each brightness level (0-255)
+        levels = np.arange(256) / 255.0
+        self._char_lut = np.array(list(self.chars), dtype=object)[(levels * (self.char_count - 1)).astype(int)]
+        
+        # The same characters as bytes for the Numba kernels (None if not single-byte)
+        chars = ''.join(self._char_lut.tolist())
+        self._char_bytes = np.frombuffer(chars.encode('ascii'), dtype=np.uint8) if chars.isascii() else None
+        
+        # Per color mode: escape codes and color ids indexed by brightness
+        self._brightness_lut = {}
+        # Per color mode: the same cells encoded for the Numba kernel
+        self._brightness_lut_bytes = {}
+        
+        # Placeholder art per width, see generate_no_cam_placeholder()
+        self._no_cam_cache = {}
+        
+        # Output buffer reused across frames by the Numba kernel
+        self._out_buf = np.empty(0, dtype=np.uint8)
+        self._out_lock = threading.Lock()
+        
         if self.debug:
             print(f"[DEBUG] AsciiConverter initialized:", file=sys.stderr)
             print(f"  Width: {self.width}", file=sys.stderr)
@@ -74,6 +324,42 @@ class AsciiConverter:
         
         return (r, g, b)
     
+    def _get_rainbow_colors(self, pixels_gray):
+        """
+        Vectorized version of _get_rainbow_color for a whole grayscale frame.
+        
+        Args:
+            pixels_gray: 2D uint8 array of brightness values
+            
+        Returns:
+            (H, W, 3) uint8 array of RGB colors
+        """
+        normalized = pixels_gray / 255.0
+        
+        r = np.zeros(pixels_gray.shape, dtype=np.uint8)
+        g = np.full(pixels_gray.shape, 255, dtype=np.uint8)
+        b = np.zeros(pixels_gray.shape, dtype=np.uint8)
+        
+        # Blue to Cyan
+        mask = normalized < 0.25
+        g[mask] = (normalized[mask] * 4 * 255).astype(np.uint8)
+        b[mask] = 255
+        
+        # Cyan to Green
+        mask = (normalized >= 0.25) & (normalized < 0.5)
+        b[mask] = ((0.5 - normalized[mask]) * 4 * 255).astype(np.uint8)
+        
+        # Green to Yellow
+        mask = (normalized >= 0.5) & (normalized < 0.75)
+        r[mask] = ((normalized[mask] - 0.5) * 4 * 255).astype(np.uint8)
+        
+        # Yellow to Red
+        mask = normalized >= 0.75
+        r[mask] = 255
+        g[mask] = ((1.0 - normalized[mask]) * 4 * 255).astype(np.uint8)
+        
+        return np.dstack((r, g, b))
+    
     def _get_solid_color(self, brightness, color_name):
         """Get a solid color with varying lightness based on brightness.
         
@@ -122,6 +408,227 @@ class AsciiConverter:
             b = int(base_b * factor)
             return (r, g, b)
     
+    def _get_solid_colors(self, pixels_gray, color_name):
+        """
+        Vectorized version of _get_solid_color for a whole grayscale frame.
+        
+        Args:
+            pixels_gray: 2D uint8 array of brightness values
+            color_name: Name of the color (red, green, blue, etc.)
+            
+        Returns:
+            (H, W, 3) uint8 array of RGB colors
+        """
+        table = np.array([self._get_solid_color(brightness, color_name) for brightness in range(256)],
+                         dtype=np.uint8)
+        return table[pixels_gray]
+    
+    def _get_palette256_indices(self, pixels_color):
+        """
+        Map RGB colors to the 6x6x6 color cube of the ANSI 256-color palette.
+        
+        Args:
+            pixels_color: (H, W, 3) uint8 array of RGB colors
+            
+        Returns:
+            2D uint8 array of palette numbers (16-231)
+        """
+        # Round each channel to the nearest of the 6 cube levels
+        levels = (pixels_color.astype(np.uint16) * 5 + 127) // 255
+        return (16 + 36 * levels[:, :, 0] + 6 * levels[:, :, 1] + levels[:, :, 2]).astype(np.uint8)
+    
+    def _get_brightness_lut(self, color_mode):
+        """
+        Get the escape codes for a brightness-based color mode (bw, rainbow or solid).
+        Built once per mode, since the color only depends on the 8-bit brightness.
+        
+        Returns:
+            (codes, color_ids) tuple: object array of 256 escape codes ('' for bw)
+            and the id of each brightness's distinct code, for detecting color runs
+        """
+        lut = self._brightness_lut.get(color_mode)
+        if lut is None:
+            if color_mode == 'bw':
+                codes = [''] * 256
+            else:
+                levels = np.arange(256, dtype=np.uint8)
+                if color_mode == 'rainbow':
+                    colors = self._get_rainbow_colors(levels)
+                else:
+                    colors = self._get_solid_colors(levels, color_mode)
+                codes = [_ansi_for(r, g, b) for r, g, b in colors.reshape(-1, 3).tolist()]
+            
+            code_ids = {}
+            color_ids = np.array([code_ids.setdefault(code, len(code_ids)) for code in codes],
+                                 dtype=np.int32)
+            lut = (np.array(codes, dtype=object), color_ids)
+            self._brightness_lut[color_mode] = lut
+        return lut
+    
+    def _get_brightness_lut_bytes(self, color_mode):
+        """
+        Get the brightness lookup tables encoded as bytes for _render_lut_kernel.
+        
+        Returns:
+            (code_bytes, char_bytes) tuple of (256, code_width) and (256,) uint8
+            arrays, or None if the character set isn't single-byte
+        """
+        if color_mode not in self._brightness_lut_bytes:
+            codes, _ = self._get_brightness_lut(color_mode)
+            encoded = None
+            if self._char_bytes is not None:
+                code_width = len(codes[0])
+                code_bytes = np.zeros((256, code_width), dtype=np.uint8)
+                if code_width:
+                    code_bytes[:] = np.frombuffer(''.join(codes).encode('ascii'),
+                                                  dtype=np.uint8).reshape(256, code_width)
+                encoded = (code_bytes, self._char_bytes)
+            self._brightness_lut_bytes[color_mode] = encoded
+        return self._brightness_lut_bytes[color_mode]
+    
+    def _get_target_size(self, original_width, original_height):
+        """
+        Calculate the output size in characters for an image.
+        
+        Returns:
+            (target_width, target_height) tuple
+        """
+        # Terminal characters are roughly 2:1 (height:width)
+        # So we need to compensate when converting pixels to characters
+        char_aspect = 0.5  # Characters are twice as tall as wide
+        
+        # Calculate target dimensions
+        target_width = self.width
+        # Preserve original image aspect ratio while accounting for char aspect
+        target_height = int((original_height / original_width) * target_width * char_aspect)
+        
+        if self.debug:
+            print(f"[DEBUG] Original: {original_width}x{original_height}", file=sys.stderr)
+            print(f"[DEBUG] Target: {target_width}x{target_height} chars", file=sys.stderr)
+        
+        return target_width, target_height
+    
+    def _render(self, image, encoded=False):
+        """
+        Convert an image to ASCII art (see image_to_ascii), raising on errors.
+        
+        Args:
+            image: PIL Image or numpy array (BGR or RGB)
+            encoded: Return UTF-8 bytes instead of a string
+        """
+        if isinstance(image, np.ndarray):
+            if self.debug:
+                print(f"[DEBUG] Input is numpy array: {image.shape}", file=sys.stderr)
+            if image.ndim == 3 and image.shape[2] == 4:
+                # 4-channel arrays are RGBA; drop alpha without a PIL round-trip
+                image = cv2.cvtColor(image, cv2.COLOR_RGBA2RGB)
+                is_bgr = False
+            else:
+                # OpenCV uses BGR
+                is_bgr = True
+        else:
+            if self.debug:
+                print(f"[DEBUG] Input is PIL Image: {image.size}", file=sys.stderr)
+            # PIL images become RGB (or grayscale) arrays, the only PIL step
+            if image.mode != 'L':
+                image = image.convert('RGB')
+            image = np.asarray(image)
+            is_bgr = False
+        
+        original_height, original_width = image.shape[:2]
+        target_width, target_height = self._get_target_size(original_width, original_height)
+        
+        # Downscale once with OpenCV's area interpolation; grayscale and
+        # color are both derived from the same resized frame
+        resized = cv2.resize(image, (target_width, target_height), interpolation=cv2.INTER_AREA)
+        
+        if resized.ndim == 3:
+            pixels_gray = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY if is_bgr else cv2.COLOR_RGB2GRAY)
+            if self.color_mode in ('normal', 'palette256'):
+                pixels_color = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB) if is_bgr else resized
+        else:
+            pixels_gray = resized
+            if self.color_mode in ('normal', 'palette256'):
+                pixels_color = cv2.cvtColor(resized, cv2.COLOR_GRAY2RGB)
+        
+        if self.debug and self.color_mode in ('normal', 'palette256'):
+            print(f"[DEBUG] Color array shape: {pixels_color.shape}", file=sys.stderr)
+        
+        # Add reset code at end of line if using colors
+        line_end = '' if self.color_mode == 'bw' else '\033[0m'
+        
+        use_kernels = NUMBA_AVAILABLE and self._char_bytes is not None
+        if use_kernels and not _kernels_ready.is_set():
+            # Don't block on compilation; NumPy renders until the kernels are ready
+            prewarm_kernels()
+            use_kernels = False
+        
+        if use_kernels:
+            # Compiled rendering into one reused byte buffer
+            line_end_bytes = np.frombuffer(line_end.encode('ascii'), dtype=np.uint8)
+            if self.color_mode == 'normal':
+                # Same 4-bit quantization as below, packed as 0xRRGGBB keys
+                quantized = ((pixels_color & 0xF0) | 0x08).astype(np.int32)
+                keys = (quantized[:, :, 0] << 16) | (quantized[:, :, 1] << 8) | quantized[:, :, 2]
+                code_width = 19
+            elif self.color_mode == 'palette256':
+                keys = self._get_palette256_indices(pixels_color).astype(np.int32)
+                code_width = 11
+            else:
+                # bw, rainbow and solid colors: lookup on brightness
+                _, color_ids = self._get_brightness_lut(self.color_mode)
+                code_bytes, char_bytes = self._get_brightness_lut_bytes(self.color_mode)
+                code_width = code_bytes.shape[1]
+            size = target_height * (target_width * (code_width + 1) + len(line_end_bytes) + 1)
+            with self._out_lock:
+                # Grow the buffer only when the frame size or mode needs more room
+                if len(self._out_buf) < size:
+                    self._out_buf = np.empty(size, dtype=np.uint8)
+                if self.color_mode in ('normal', 'palette256'):
+                    size = _render_color_kernel(pixels_gray, keys, self.color_mode == 'palette256',
+                                                self._char_bytes, line_end_bytes, self._out_buf)
+                else:
+                    size = _render_lut_kernel(pixels_gray, color_ids, code_bytes, char_bytes,
+                                              line_end_bytes, self._out_buf)
+                ascii_art = self._out_buf[:size].tobytes()
+            if not encoded:
+                ascii_art = ascii_art.decode('utf-8')
+        else:
+            # Escape codes are only emitted where the color changes along a line
+            changed = np.ones(pixels_gray.shape, dtype=bool)
+        
+            if self.color_mode == 'normal':
+                # Original image colors, quantized to 4 bits per channel
+                # (center of each bin) so neighbouring pixels share a code
+                quantized = (pixels_color & 0xF0) | 0x08
+                changed[:, 1:] = np.any(quantized[:, 1:] != quantized[:, :-1], axis=2)
+                prefixes = np.full(pixels_gray.shape, '', dtype=object)
+                prefixes[changed] = [_ansi_for(r, g, b) for r, g, b in quantized[changed].tolist()]
+            elif self.color_mode == 'palette256':
+                # Original image colors as 256-color codes (about half the bytes)
+                palette = self._get_palette256_indices(pixels_color)
+                changed[:, 1:] = palette[:, 1:] != palette[:, :-1]
+                prefixes = np.where(changed, PALETTE256_CODES[palette], '')
+            else:
+                # bw, rainbow and solid colors are a pure lookup on brightness
+                codes, color_ids = self._get_brightness_lut(self.color_mode)
+                pixels_ids = color_ids[pixels_gray]
+                changed[:, 1:] = pixels_ids[:, 1:] != pixels_ids[:, :-1]
+                prefixes = np.where(changed, codes[pixels_gray], '')
+        
+            pixels_cells = prefixes + self._char_lut[pixels_gray]
+            ascii_art = '\n'.join(''.join(row) + line_end for row in pixels_cells.tolist())
+            if encoded:
+                ascii_art = ascii_art.encode('utf-8')
+        
+        if self.debug:
+            print(f"[DEBUG] Generated {target_height} lines of ASCII", file=sys.stderr)
+            if target_height:
+                first_line = ascii_art.split(b'\n' if encoded else '\n', 1)[0]
+                print(f"[DEBUG] First line length: {len(first_line)} chars", file=sys.stderr)
+        
+        return ascii_art
+    
     def image_to_ascii(self, image):
         """
         Convert a PIL Image or numpy array to ASCII art.
@@ -134,101 +641,7 @@ class AsciiConverter:
             String containing ASCII art with newlines (with ANSI color codes if color_mode != 'bw')
         """
         try:
-            # Convert to PIL Image if numpy array
-            if isinstance(image, np.ndarray):
-                if self.debug:
-                    print(f"[DEBUG] Input is numpy array: {image.shape}", file=sys.stderr)
-                
-                # OpenCV uses BGR, convert to RGB
-                if len(image.shape) == 3 and image.shape[2] == 3:
-                    image_rgb = image[:, :, ::-1]
-                    image_color = Image.fromarray(image_rgb)
-                    image = Image.fromarray(image_rgb)
-                else:
-                    image_color = Image.fromarray(image)
-                    image = Image.fromarray(image)
-            else:
-                if self.debug:
-                    print(f"[DEBUG] Input is PIL Image: {image.size}", file=sys.stderr)
-                image_color = image.copy()
-            
-            # Calculate height to maintain original image aspect ratio
-            # AND account for terminal character aspect ratio
-            original_width, original_height = image.size
-            
-            # Terminal characters are roughly 2:1 (height:width)
-            # So we need to compensate when converting pixels to characters
-            char_aspect = 0.5  # Characters are twice as tall as wide
-            
-            # Calculate target dimensions
-            target_width = self.width
-            # Preserve original image aspect ratio while accounting for char aspect
-            target_height = int((original_height / original_width) * target_width * char_aspect)
-            
-            if self.debug:
-                print(f"[DEBUG] Original: {original_width}x{original_height}", file=sys.stderr)
-                print(f"[DEBUG] Target: {target_width}x{target_height} chars", file=sys.stderr)
-            
-            # Resize image to target resolution
-            image = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
-            image_color = image_color.resize((target_width, target_height), Image.Resampling.LANCZOS)
-            
-            # Convert to grayscale for character selection
-            image_gray = image.convert('L')
-            pixels_gray = np.array(image_gray)
-            
-            # Get color information if needed
-            if self.color_mode != 'bw':
-                pixels_color = np.array(image_color.convert('RGB'))
-                if self.debug:
-                    print(f"[DEBUG] Color array shape: {pixels_color.shape}", file=sys.stderr)
-            
-            # Map pixel values (0-255) to character indices
-            normalized = pixels_gray / 255.0
-            char_indices = (normalized * (self.char_count - 1)).astype(int)
-            
-            # Build ASCII string with colors
-            ascii_lines = []
-            for y in range(target_height):
-                line_chars = []
-                for x in range(target_width):
-                    char = self.chars[char_indices[y, x]]
-                    
-                    if self.color_mode == 'bw':
-                        # Black and white - no color codes
-                        line_chars.append(char)
-                    elif self.color_mode == 'rainbow':
-                        # Rainbow heatmap based on brightness
-                        brightness = pixels_gray[y, x]
-                        r, g, b = self._get_rainbow_color(brightness)
-                        # ANSI 24-bit color escape code
-                        color_code = f'\033[38;2;{r};{g};{b}m'
-                        line_chars.append(f'{color_code}{char}')
-                    elif self.color_mode == 'normal':
-                        # Original image colors
-                        r, g, b = pixels_color[y, x]
-                        color_code = f'\033[38;2;{r};{g};{b}m'
-                        line_chars.append(f'{color_code}{char}')
-                    else:
-                        # Solid color modes: red, green, blue, yellow, magenta, cyan, white, black
-                        brightness = pixels_gray[y, x]
-                        r, g, b = self._get_solid_color(brightness, self.color_mode)
-                        color_code = f'\033[38;2;{r};{g};{b}m'
-                        line_chars.append(f'{color_code}{char}')
-                
-                # Add reset code at end of line if using colors
-                if self.color_mode != 'bw':
-                    line_chars.append('\033[0m')
-                
-                ascii_lines.append(''.join(line_chars))
-            
-            if self.debug:
-                print(f"[DEBUG] Generated {len(ascii_lines)} lines of ASCII", file=sys.stderr)
-                if ascii_lines:
-                    print(f"[DEBUG] First line length: {len(ascii_lines[0])} chars", file=sys.stderr)
-            
-            return '\n'.join(ascii_lines)
-            
+            return self._render(image)
         except Exception as e:
             print(f"[ERROR] image_to_ascii failed: {e}", file=sys.stderr)
             import traceback
@@ -236,43 +649,58 @@ class AsciiConverter:
             # Return error message as ASCII
             return f"ERROR: {str(e)}"
     
+    def image_to_ascii_to_stdout(self, image):
+        """
+        Convert an image and draw it from the top-left corner of the terminal.
+        
+        The frame is assembled as bytes and written to sys.stdout.buffer in a
+        single write, skipping the str round-trip and print()'s encoding.
+        Moving the cursor home instead of clearing the screen avoids flicker.
+        """
+        try:
+            frame = self._render(image, encoded=True)
+        except Exception as e:
+            print(f"[ERROR] image_to_ascii failed: {e}", file=sys.stderr)
+            return
+        
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b'\033[H' + frame)
+        sys.stdout.buffer.flush()
+    
     def set_width(self, width):
         """Update the target width for ASCII conversion."""
         self.width = width
+        self._no_cam_cache.clear()
         if self.debug:
             print(f"[DEBUG] Width updated to {width}", file=sys.stderr)
     
     def generate_no_cam_placeholder(self):
-        """Generate a 'No Cam' placeholder ASCII art."""
-        lines = []
+        """Generate a 'No Cam' placeholder ASCII art (cached per width)."""
         width = self.width
+        if width in self._no_cam_cache:
+            return self._no_cam_cache[width]
+        
         height = max(10, width // 3)
         
         # Create border
         border = "═" * width
-        lines.append(border)
-        
-        # Add some padding
-        lines.append("║" + " " * (width - 2) + "║")
+        empty_line = "║" + " " * (width - 2) + "║"
         
         # Center the "No Cam" message
         message = "NO CAM"
         padding = (width - len(message) - 2) // 2
-        line = "║" + " " * padding + message + " " * (width - len(message) - padding - 2) + "║"
-        lines.append(line)
-        
-        # Add more padding
-        for _ in range(height - 4):
-            lines.append("║" + " " * (width - 2) + "║")
+        message_line = "║" + " " * padding + message + " " * (width - len(message) - padding - 2) + "║"
         
-        # Bottom border
-        lines.append(border)
+        # Border, padding, message, more padding, bottom border
+        lines = [border, empty_line, message_line] + [empty_line] * (height - 4) + [border]
         
-        return "\n".join(lines)
+        placeholder = "\n".join(lines)
+        self._no_cam_cache[width] = placeholder
+        return placeholder
     
     def set_color_mode(self, mode):
-        """Update color mode: 'rainbow', 'bw', 'normal', or solid color names."""
-        valid_modes = ['rainbow', 'bw', 'normal', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan', 'white', 'black']
+        """Update color mode: 'rainbow', 'bw', 'normal', 'palette256', or solid color names."""
+        valid_modes = ['rainbow', 'bw', 'normal', 'palette256', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan', 'white', 'black']
         if mode in valid_modes:
             self.color_mode = mode
             if self.debug:
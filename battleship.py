@@ -3,8 +3,57 @@ Battleship Game - Classic naval combat game
 """
 import random
 import time
+from collections import deque
 from enum import Enum
-from typing import List, Tuple, Optional, Set
+from typing import Deque, Dict, FrozenSet, List, Tuple, Optional, Set
+
+import numpy as np
+
+
+GRID_SIZE = 10
+
+
+def cell_bit(position: Tuple[int, int]) -> int:
+    """Get the bitboard bit for a grid position."""
+    row, col = position
+    return 1 << (row * GRID_SIZE + col)
+
+
+def _build_placement_masks() -> Dict[Tuple[int, bool], List[Tuple[Tuple[int, int], int]]]:
+    """Enumerate every in-bounds placement for each ship size and orientation."""
+    masks = {}
+    for size in range(1, GRID_SIZE + 1):
+        for is_horizontal in (True, False):
+            candidates = []
+            for row in range(GRID_SIZE if is_horizontal else GRID_SIZE - size + 1):
+                for col in range(GRID_SIZE - size + 1 if is_horizontal else GRID_SIZE):
+                    if is_horizontal:
+                        cells = [(row, col + i) for i in range(size)]
+                    else:
+                        cells = [(row + i, col) for i in range(size)]
+                    candidates.append(((row, col), sum(cell_bit(pos) for pos in cells)))
+            masks[(size, is_horizontal)] = candidates
+    return masks
+
+
+# Coordinate string <-> (row, col) lookups, e.g. "A5" <-> (0, 4)
+COORD_TO_POS: Dict[str, Tuple[int, int]] = {
+    f"{chr(ord('A') + row)}{col + 1}": (row, col)
+    for row in range(GRID_SIZE) for col in range(GRID_SIZE)
+}
+POS_TO_COORD: Dict[Tuple[int, int], str] = {pos: coord for coord, pos in COORD_TO_POS.items()}
+
+# In-bounds orthogonal neighbors (N, S, W, E) of every cell
+NEIGHBORS: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]] = {
+    (row, col): tuple(
+        (r, c) for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+        if 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE
+    )
+    for row in range(GRID_SIZE) for col in range(GRID_SIZE)
+}
+
+# (ship_size, is_horizontal) -> [(start_pos, mask), ...]
+PLACEMENT_MASKS = _build_placement_masks()
 
 
 class CellState(Enum):
@@ -16,6 +65,38 @@ class CellState(Enum):
     SUNK = "#"
 
 
+# ANSI color codes
+BLUE = '\033[94m'    # Ships
+RED = '\033[91m'     # Hits
+YELLOW = '\033[93m'  # Misses
+GRAY = '\033[90m'    # Sunk ships
+CYAN = '\033[96m'    # Water
+RESET = '\033[0m'
+BOLD = '\033[1m'
+
+# Board header and row labels, e.g. "     1  2 ..." and " A  "
+_HEADER_LINE = "    " + " ".join(f"{i:2}" for i in range(1, GRID_SIZE + 1))
+_ROW_PREFIXES = tuple(f" {chr(ord('A') + row)}  " for row in range(GRID_SIZE))
+
+# Integer cell codes used by the board renderer
+CELL_EMPTY, CELL_SHIP, CELL_HIT, CELL_MISS, CELL_SUNK = range(5)
+CELL_CODE_STATES = (CellState.EMPTY, CellState.SHIP, CellState.HIT, CellState.MISS, CellState.SUNK)
+
+# Rendered cell strings per state
+CELL_FMT_COLOR: Dict[CellState, str] = {
+    CellState.EMPTY: f" {CYAN}{CellState.EMPTY.value}{RESET} ",
+    CellState.SHIP: f" {BLUE}{BOLD}{CellState.SHIP.value}{RESET} ",
+    CellState.HIT: f" {RED}{BOLD}{CellState.HIT.value}{RESET} ",
+    CellState.MISS: f" {YELLOW}{CellState.MISS.value}{RESET} ",
+    CellState.SUNK: f" {GRAY}{CellState.SUNK.value}{RESET} ",
+}
+CELL_FMT_PLAIN: Dict[CellState, str] = {state: f" {state.value} " for state in CellState}
+
+# The same strings indexed by cell code, for vectorized lookup
+CELL_STRINGS_COLOR = np.array([CELL_FMT_COLOR[state] for state in CELL_CODE_STATES], dtype=object)
+CELL_STRINGS_PLAIN = np.array([CELL_FMT_PLAIN[state] for state in CELL_CODE_STATES], dtype=object)
+
+
 class Orientation(Enum):
     """Ship orientation."""
     HORIZONTAL = "H"
@@ -25,6 +106,10 @@ class Orientation(Enum):
 class Ship:
     """Represents a ship on the grid."""
     
+    __slots__ = ("name", "size", "start_pos", "orientation", "is_horizontal",
+                 "hit_positions", "_hit_count", "_sunk",
+                 "_positions_tuple", "_positions_set", "mask")
+    
     def __init__(self, name: str, size: int, start_pos: Tuple[int, int], orientation: Orientation):
         """
         Initialize a ship.
@@ -39,24 +124,30 @@ class Ship:
         self.size = size
         self.start_pos = start_pos
         self.orientation = orientation
+        self.is_horizontal = orientation is Orientation.HORIZONTAL
         self.hit_positions: Set[Tuple[int, int]] = set()
+        self._hit_count = 0
+        self._sunk = False
+        
+        # Ships never move, so compute the occupied cells once
+        row, col = start_pos
+        if self.is_horizontal:
+            cells = tuple((row, col + i) for i in range(size))
+        else:
+            cells = tuple((row + i, col) for i in range(size))
+        self._positions_tuple: Tuple[Tuple[int, int], ...] = cells
+        self._positions_set: FrozenSet[Tuple[int, int]] = frozenset(cells)
+        self.mask = sum(cell_bit(pos) for pos in cells)
         
     @property
-    def positions(self) -> List[Tuple[int, int]]:
+    def positions(self) -> Tuple[Tuple[int, int], ...]:
         """Get all positions occupied by this ship."""
-        positions = []
-        row, col = self.start_pos
-        for i in range(self.size):
-            if self.orientation == Orientation.HORIZONTAL:
-                positions.append((row, col + i))
-            else:
-                positions.append((row + i, col))
-        return positions
+        return self._positions_tuple
     
     @property
     def is_sunk(self) -> bool:
         """Check if ship is completely sunk."""
-        return len(self.hit_positions) == self.size
+        return self._sunk
     
     def hit(self, position: Tuple[int, int]) -> bool:
         """
@@ -68,10 +159,19 @@ class Ship:
         Returns:
             True if this was a valid hit, False otherwise
         """
-        if position in self.positions:
-            self.hit_positions.add(position)
+        if position in self._positions_set:
+            if position not in self.hit_positions:
+                self.hit_positions.add(position)
+                self._hit_count += 1
+                if self._hit_count == self.size:
+                    self._sunk = True
             return True
         return False
+    
+    def mark_sunk(self) -> None:
+        """Mark every cell of the ship as hit (e.g., when told it sank)."""
+        for position in self._positions_tuple:
+            self.hit(position)
 
 
 class BattleshipGame:
@@ -86,7 +186,7 @@ class BattleshipGame:
         ("Destroyer", 2)
     ]
     
-    GRID_SIZE = 10
+    GRID_SIZE = GRID_SIZE
     
     def __init__(self, mode: str = "vs_human"):
         """
@@ -106,6 +206,20 @@ class BattleshipGame:
         self.player_attacks: Set[Tuple[int, int]] = set()
         self.opponent_attacks: Set[Tuple[int, int]] = set()
         
+        # Bitboards: one bit per cell, row-major
+        self.player_ships_mask = 0
+        self.opponent_ships_mask = 0
+        self.player_hits_mask = 0  # Hits landed on player ships
+        self.opponent_hits_mask = 0  # Hits landed on opponent ships
+        
+        # Cell -> ship lookup for placed ships
+        self.player_cell_to_ship: Dict[Tuple[int, int], Ship] = {}
+        self.opponent_cell_to_ship: Dict[Tuple[int, int], Ship] = {}
+        
+        # Number of ships sunk on each side
+        self.player_sunk_count = 0
+        self.opponent_sunk_count = 0
+        
         # Game state
         self.game_phase = "setup"  # "setup", "playing", "finished"
         self.player_turn = True
@@ -122,27 +236,7 @@ class BattleshipGame:
         Returns:
             (row, col) tuple or None if invalid
         """
-        coord = coord.strip().upper()
-        if len(coord) < 2:
-            return None
-        
-        row_char = coord[0]
-        col_str = coord[1:]
-        
-        if row_char < 'A' or row_char > 'J':
-            return None
-        
-        try:
-            col = int(col_str)
-            if col < 1 or col > 10:
-                return None
-        except ValueError:
-            return None
-        
-        row = ord(row_char) - ord('A')
-        col = col - 1
-        
-        return (row, col)
+        return COORD_TO_POS.get(coord.strip().upper())
     
     @staticmethod
     def pos_to_coord(pos: Tuple[int, int]) -> str:
@@ -155,10 +249,7 @@ class BattleshipGame:
         Returns:
             Coordinate string (e.g., "A5")
         """
-        row, col = pos
-        row_char = chr(ord('A') + row)
-        col_num = col + 1
-        return f"{row_char}{col_num}"
+        return POS_TO_COORD[pos]
     
     def is_valid_placement(self, ship_size: int, start_pos: Tuple[int, int], 
                           orientation: Orientation, ships: List[Ship]) -> bool:
@@ -175,31 +266,31 @@ class BattleshipGame:
             True if placement is valid
         """
         row, col = start_pos
+        is_horizontal = orientation is Orientation.HORIZONTAL
         
         # Check bounds
-        if orientation == Orientation.HORIZONTAL:
+        if row < 0 or col < 0:
+            return False
+        if is_horizontal:
             if col + ship_size > self.grid_size:
                 return False
         else:
             if row + ship_size > self.grid_size:
                 return False
         
-        # Get positions this ship would occupy
-        positions = []
-        for i in range(ship_size):
-            if orientation == Orientation.HORIZONTAL:
-                positions.append((row, col + i))
-            else:
-                positions.append((row + i, col))
+        # Bitboard of the cells this ship would occupy
+        step = 1 if is_horizontal else self.grid_size
+        mask = 0
+        bit = cell_bit(start_pos)
+        for _ in range(ship_size):
+            mask |= bit
+            bit <<= step
         
         # Check for overlaps with existing ships
+        ships_mask = 0
         for ship in ships:
-            ship_positions = ship.positions
-            for pos in positions:
-                if pos in ship_positions:
-                    return False
-        
-        return True
+            ships_mask |= ship.mask
+        return not ships_mask & mask
     
     def place_ship(self, name: str, size: int, start_pos: Tuple[int, int], 
                    orientation: Orientation, is_player: bool = True) -> bool:
@@ -223,6 +314,14 @@ class BattleshipGame:
         
         ship = Ship(name, size, start_pos, orientation)
         ships.append(ship)
+        if is_player:
+            self.player_ships_mask |= ship.mask
+            cell_to_ship = self.player_cell_to_ship
+        else:
+            self.opponent_ships_mask |= ship.mask
+            cell_to_ship = self.opponent_cell_to_ship
+        for pos in ship._positions_tuple:
+            cell_to_ship[pos] = ship
         return True
     
     def attack(self, position: Tuple[int, int], is_player_attacking: bool = True) -> Tuple[str, Optional[str]]:
@@ -247,10 +346,10 @@ class BattleshipGame:
         # Check which side is being attacked
         if is_player_attacking:
             attacks = self.player_attacks
-            ships = self.opponent_ships
+            cell_to_ship = self.opponent_cell_to_ship
         else:
             attacks = self.opponent_attacks
-            ships = self.player_ships
+            cell_to_ship = self.player_cell_to_ship
         
         # Check if already attacked
         if position in attacks:
@@ -260,14 +359,38 @@ class BattleshipGame:
         attacks.add(position)
         
         # Check for hit
-        for ship in ships:
-            if position in ship.positions:
-                ship.hit(position)
-                if ship.is_sunk:
-                    return ("sunk", ship.name)
-                return ("hit", None)
+        ship = cell_to_ship.get(position)
+        if ship is None:
+            return ("miss", None)
         
-        return ("miss", None)
+        if is_player_attacking:
+            self.opponent_hits_mask |= cell_bit(position)
+        else:
+            self.player_hits_mask |= cell_bit(position)
+        
+        ship.hit(position)
+        if ship.is_sunk:
+            if is_player_attacking:
+                self.opponent_sunk_count += 1
+            else:
+                self.player_sunk_count += 1
+            return ("sunk", ship.name)
+        return ("hit", None)
+    
+    def mark_opponent_ship_sunk(self, ship_name: str) -> None:
+        """
+        Record that an opponent ship was sunk without attacking it locally.
+        
+        Used in multiplayer, where the opponent reports sinkings.
+        
+        Args:
+            ship_name: Name of the sunk ship
+        """
+        for ship in self.opponent_ships:
+            if ship.name == ship_name and not ship.is_sunk:
+                ship.mark_sunk()
+                self.opponent_sunk_count += 1
+                break
     
     def get_cell_state(self, position: Tuple[int, int], is_player_grid: bool, 
                        show_ships: bool = True) -> CellState:
@@ -283,27 +406,26 @@ class BattleshipGame:
             CellState enum value
         """
         if is_player_grid:
-            ships = self.player_ships
+            cell_to_ship = self.player_cell_to_ship
             attacks = self.opponent_attacks
         else:
-            ships = self.opponent_ships
+            cell_to_ship = self.opponent_cell_to_ship
             attacks = self.player_attacks
         
+        ship = cell_to_ship.get(position)
+        
         # Check if position was attacked
         if position in attacks:
             # Check if it's a hit
-            for ship in ships:
-                if position in ship.positions:
-                    if ship.is_sunk:
-                        return CellState.SUNK
-                    return CellState.HIT
-            return CellState.MISS
+            if ship is None:
+                return CellState.MISS
+            if ship.is_sunk:
+                return CellState.SUNK
+            return CellState.HIT
         
         # Show ships if allowed (player's own grid)
-        if show_ships:
-            for ship in ships:
-                if position in ship.positions:
-                    return CellState.SHIP
+        if show_ships and ship is not None:
+            return CellState.SHIP
         
         return CellState.EMPTY
     
@@ -315,11 +437,11 @@ class BattleshipGame:
             "player", "opponent", or None
         """
         # Check if all opponent ships are sunk
-        if all(ship.is_sunk for ship in self.opponent_ships):
+        if self.opponent_sunk_count == len(self.opponent_ships):
             return "player"
         
         # Check if all player ships are sunk
-        if all(ship.is_sunk for ship in self.player_ships):
+        if self.player_sunk_count == len(self.player_ships):
             return "opponent"
         
         return None
@@ -334,8 +456,53 @@ class BattleshipGame:
         Returns:
             Number of ships still afloat
         """
-        ships = self.player_ships if is_player else self.opponent_ships
-        return sum(1 for ship in ships if not ship.is_sunk)
+        if is_player:
+            return len(self.player_ships) - self.player_sunk_count
+        return len(self.opponent_ships) - self.opponent_sunk_count
+    
+    def _mask_grid(self, mask: int) -> np.ndarray:
+        """Unpack a bitboard into a boolean grid."""
+        cells = self.grid_size * self.grid_size
+        raw = np.frombuffer(mask.to_bytes((cells + 7) // 8, 'little'), dtype=np.uint8)
+        bits = np.unpackbits(raw, bitorder='little')[:cells]
+        return bits.reshape(self.grid_size, self.grid_size).astype(bool)
+    
+    def get_state_grid(self, is_player_grid: bool, show_ships: bool = True) -> np.ndarray:
+        """
+        Get the display state of every cell at once.
+        
+        Args:
+            is_player_grid: True for player's grid, False for opponent's
+            show_ships: Whether to show ship positions
+            
+        Returns:
+            grid_size x grid_size array of CELL_* codes
+        """
+        if is_player_grid:
+            ships = self.player_ships
+            ships_mask = self.player_ships_mask
+            attacks = self.opponent_attacks
+        else:
+            ships = self.opponent_ships
+            ships_mask = self.opponent_ships_mask
+            attacks = self.player_attacks
+        
+        sunk_mask = 0
+        for ship in ships:
+            if ship.is_sunk:
+                sunk_mask |= ship.mask
+        
+        is_ship = self._mask_grid(ships_mask)
+        is_sunk = self._mask_grid(sunk_mask & ships_mask)
+        attacked = np.zeros((self.grid_size, self.grid_size), dtype=bool)
+        if attacks:
+            rows, cols = zip(*attacks)
+            attacked[rows, cols] = True
+        
+        hit_codes = np.where(is_sunk, CELL_SUNK, CELL_HIT)
+        attacked_codes = np.where(is_ship, hit_codes, CELL_MISS)
+        idle_codes = np.where(is_ship & show_ships, CELL_SHIP, CELL_EMPTY)
+        return np.where(attacked, attacked_codes, idle_codes)
     
     def get_board_display(self, is_player_grid: bool, show_ships: bool = True, use_color: bool = True) -> str:
         """
@@ -349,45 +516,12 @@ class BattleshipGame:
         Returns:
             ASCII board string
         """
-        lines = []
-        
-        # ANSI color codes
-        BLUE = '\033[94m'    # Ships
-        RED = '\033[91m'     # Hits
-        YELLOW = '\033[93m'  # Misses
-        GRAY = '\033[90m'    # Sunk ships
-        CYAN = '\033[96m'    # Water
-        RESET = '\033[0m'
-        BOLD = '\033[1m'
-        
-        # Header
-        header = "    " + " ".join(f"{i:2}" for i in range(1, self.grid_size + 1))
-        lines.append(header)
+        codes = self.get_state_grid(is_player_grid, show_ships)
+        cell_strings = (CELL_STRINGS_COLOR if use_color else CELL_STRINGS_PLAIN)[codes]
         
-        # Rows
+        lines = [_HEADER_LINE]
         for row in range(self.grid_size):
-            row_char = chr(ord('A') + row)
-            row_str = f" {row_char}  "
-            
-            for col in range(self.grid_size):
-                state = self.get_cell_state((row, col), is_player_grid, show_ships)
-                
-                if use_color:
-                    # Apply colors based on state
-                    if state == CellState.SHIP:
-                        row_str += f" {BLUE}{BOLD}{state.value}{RESET} "
-                    elif state == CellState.HIT:
-                        row_str += f" {RED}{BOLD}{state.value}{RESET} "
-                    elif state == CellState.MISS:
-                        row_str += f" {YELLOW}{state.value}{RESET} "
-                    elif state == CellState.SUNK:
-                        row_str += f" {GRAY}{state.value}{RESET} "
-                    else:  # EMPTY
-                        row_str += f" {CYAN}{state.value}{RESET} "
-                else:
-                    row_str += f" {state.value} "
-            
-            lines.append(row_str)
+            lines.append(_ROW_PREFIXES[row] + "".join(cell_strings[row]))
         
         return "\n".join(lines)
 
@@ -404,45 +538,41 @@ class BattleshipAI:
         """
         self.game = game
         self.last_hit: Optional[Tuple[int, int]] = None
-        self.hunt_targets: List[Tuple[int, int]] = []
+        self.hunt_targets: Deque[Tuple[int, int]] = deque()
+        self.hunt_set: Set[Tuple[int, int]] = set()
         self.hit_sequence: List[Tuple[int, int]] = []
         
+        # Random search order, shuffled once; cells already attacked are skipped
+        self.search_order: List[Tuple[int, int]] = [
+            (row, col) for row in range(game.grid_size) for col in range(game.grid_size)
+        ]
+        random.shuffle(self.search_order)
+        self.search_index = 0
+        
+        # Cells attacked so far and enemy ships still afloat, for probability targeting
+        self.attack_grid = np.zeros((game.grid_size, game.grid_size), dtype=np.uint8)
+        self.remaining_ship_sizes: Dict[str, int] = dict(BattleshipGame.SHIP_TYPES)
+        
     def place_ships(self) -> None:
         """Place AI ships randomly."""
         for name, size in BattleshipGame.SHIP_TYPES:
-            placed = False
-            attempts = 0
-            max_attempts = 100
+            candidates = [
+                (start_pos, mask, orientation)
+                for orientation in (Orientation.HORIZONTAL, Orientation.VERTICAL)
+                for start_pos, mask in PLACEMENT_MASKS[(size, orientation is Orientation.HORIZONTAL)]
+            ]
+            random.shuffle(candidates)
             
-            while not placed and attempts < max_attempts:
-                # Random position and orientation
-                row = random.randint(0, self.game.grid_size - 1)
-                col = random.randint(0, self.game.grid_size - 1)
-                orientation = random.choice([Orientation.HORIZONTAL, Orientation.VERTICAL])
-                
-                placed = self.game.place_ship(name, size, (row, col), orientation, is_player=False)
-                attempts += 1
+            # First candidate that doesn't overlap the ships placed so far
+            for start_pos, mask, orientation in candidates:
+                if not mask & self.game.opponent_ships_mask:
+                    self.game.place_ship(name, size, start_pos, orientation, is_player=False)
+                    break
     
     def get_adjacent_cells(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid adjacent cells (N, S, E, W)."""
-        row, col = position
-        adjacent = [
-            (row - 1, col),  # North
-            (row + 1, col),  # South
-            (row, col - 1),  # West
-            (row, col + 1),  # East
-        ]
-        
-        # Filter to valid positions that haven't been attacked
-        valid = []
-        for pos in adjacent:
-            r, c = pos
-            if (0 <= r < self.game.grid_size and 
-                0 <= c < self.game.grid_size and
-                pos not in self.game.opponent_attacks):
-                valid.append(pos)
-        
-        return valid
+        """Get valid adjacent cells (N, S, W, E) that haven't been attacked."""
+        attacks = self.game.opponent_attacks
+        return [pos for pos in NEIGHBORS[position] if pos not in attacks]
     
     def choose_attack(self) -> Tuple[int, int]:
         """
@@ -484,17 +614,55 @@ class BattleshipAI:
         
         # Hunt mode: Check cells adjacent to last hit
         if self.hunt_targets:
-            return self.hunt_targets.pop(0)
+            pos = self.hunt_targets.popleft()
+            self.hunt_set.discard(pos)
+            return pos
+        
+        # Search mode: Cell covered by the most possible ship placements
+        prob = self.get_probability_grid()
+        best = prob.max()
+        if best > 0:
+            candidates = np.flatnonzero(prob == best)
+            row, col = divmod(int(random.choice(candidates)), self.game.grid_size)
+            return (row, col)
+        
+        # No placement fits anymore: Next unattacked cell in the shuffled order
+        while self.search_index < len(self.search_order):
+            pos = self.search_order[self.search_index]
+            self.search_index += 1
+            if pos not in self.game.opponent_attacks:
+                return pos
+        
+        return (0, 0)
+    
+    def get_probability_grid(self) -> np.ndarray:
+        """
+        Count how many placements of the remaining ships cover each cell.
         
-        # Search mode: Random attack
-        available = []
-        for row in range(self.game.grid_size):
-            for col in range(self.game.grid_size):
-                pos = (row, col)
-                if pos not in self.game.opponent_attacks:
-                    available.append(pos)
+        A placement is possible if it touches no attacked cell.
         
-        return random.choice(available) if available else (0, 0)
+        Returns:
+            grid_size x grid_size array of placement counts
+        """
+        size = self.game.grid_size
+        prob = np.zeros((size, size), dtype=np.int32)
+        
+        # Rows of the grid for horizontal placements, rows of its transpose for vertical ones
+        for blocked, out in ((self.attack_grid, prob), (self.attack_grid.T, prob.T)):
+            cumsum = np.zeros((size, size + 1), dtype=np.int32)
+            np.cumsum(blocked, axis=1, out=cumsum[:, 1:])
+            for length in self.remaining_ship_sizes.values():
+                if length > size:
+                    continue
+                # valid[r, c]: a ship can start at column c of row r
+                valid = (cumsum[:, length:] - cumsum[:, :-length]) == 0
+                # Spread each valid start over the `length` cells it covers
+                coverage = np.zeros((size, size + 1), dtype=np.int32)
+                coverage[:, :size - length + 1] += valid
+                coverage[:, length:] -= valid
+                out += np.cumsum(coverage, axis=1)[:, :size]
+        
+        return prob
     
     def process_result(self, position: Tuple[int, int], result: str, ship_name: Optional[str]) -> None:
         """
@@ -505,6 +673,9 @@ class BattleshipAI:
             result: Attack result ("hit", "miss", "sunk")
             ship_name: Name of ship if sunk
         """
+        if result in ("hit", "miss", "sunk"):
+            self.attack_grid[position] = 1
+        
         if result == "hit":
             self.last_hit = position
             self.hit_sequence.append(position)
@@ -512,13 +683,16 @@ class BattleshipAI:
             # Add adjacent cells to hunt targets
             adjacent = self.get_adjacent_cells(position)
             for adj in adjacent:
-                if adj not in self.hunt_targets:
+                if adj not in self.hunt_set:
+                    self.hunt_set.add(adj)
                     self.hunt_targets.append(adj)
         
         elif result == "sunk":
             # Ship sunk - reset hunt mode
+            self.remaining_ship_sizes.pop(ship_name, None)
             self.last_hit = None
             self.hunt_targets.clear()
+            self.hunt_set.clear()
             self.hit_sequence.clear()
         
         elif result == "miss":
@@ -3,6 +3,7 @@
 Universal build script for ASCII Video Chat
 Detects platform and builds appropriate executable
 """
+import importlib.util
 import platform
 import subprocess
 import sys
@@ -17,18 +18,19 @@ def main():
     print(f"\nDetected platform: {platform.system()}")
     print()
     
-    # Install PyInstaller
+    # Install PyInstaller (skipped on repeat builds)
     print("Step 1: Installing PyInstaller...")
-    pip_cmd = "pip" if system == "windows" else "pip3"
-    result = subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], 
-                          capture_output=True)
-    
-    if result.returncode != 0:
-        print("ERROR: Failed to install PyInstaller")
-        print(result.stderr.decode())
-        return 1
-    
-    print("✓ PyInstaller installed")
+    if importlib.util.find_spec("PyInstaller") is None:
+        # Output streams straight to the console so a stalled pip is visible
+        result = subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        
+        if result.returncode != 0:
+            print("ERROR: Failed to install PyInstaller")
+            return 1
+        
+        print("✓ PyInstaller installed")
+    else:
+        print("✓ PyInstaller already installed")
     print()
     
     # Build executable
@@ -45,14 +47,19 @@ def main():
     if system == "windows":
         exe_name += ".exe"
     
-    result = subprocess.run([
+    build_cmd = [
         sys.executable, "-m", "PyInstaller",
         "--onefile",
         "--name", "ascii-video-chat",
         "--console",
         "--add-data", add_data_arg,
-        "main.py"
-    ])
+    ]
+    
+    # Keep PyInstaller's temporary build files in RAM where available
+    if os.path.isdir("/dev/shm"):
+        build_cmd += ["--workpath", "/dev/shm/pyi_build"]
+    
+    result = subprocess.run(build_cmd + ["main.py"])
     
     if result.returncode != 0:
         print("\nERROR: Build failed")
@@ -1,9 +1,47 @@
 """
 Quick diagnostic script to find the import error
 """
+import importlib
+import importlib.util
 import sys
 import traceback
 
+# (module, names to import from it), in dependency order
+CHECKS = [
+    ("video_capture", ("VideoCapture",)),
+    ("ascii_converter", ("AsciiConverter",)),
+    ("network", ("NetworkConnection", "NetworkServer")),
+    ("terminal_ui", ("TerminalUI", "InputHandler")),
+    ("session", ("ChatSession",)),
+]
+
+
+def check(module_name, names):
+    """
+    Import a module and look up the given names.
+    
+    Returns:
+        True if the import succeeded
+    """
+    label = f"{module_name}.{', '.join(names)}"
+    
+    # Cheap presence check before paying for module initialization
+    if importlib.util.find_spec(module_name) is None:
+        print(f"✗ {label} failed: module {module_name} not found")
+        return False
+    
+    try:
+        module = importlib.import_module(module_name)
+        for name in names:
+            getattr(module, name)
+        print(f"✓ {label}")
+        return True
+    except Exception:
+        print(f"✗ {label} failed:")
+        traceback.print_exc()
+        return False
+
+
 print("Testing imports in order...\n")
 
 # Test 1: Basic imports
@@ -15,43 +53,8 @@ except Exception as e:
     print(f"✗ Basic imports failed: {e}")
     sys.exit(1)
 
-# Test 2: video_capture
-try:
-    from video_capture import VideoCapture
-    print("✓ video_capture.VideoCapture")
-except Exception as e:
-    print(f"✗ video_capture failed:")
-    traceback.print_exc()
-
-# Test 3: ascii_converter
-try:
-    from ascii_converter import AsciiConverter
-    print("✓ ascii_converter.AsciiConverter")
-except Exception as e:
-    print(f"✗ ascii_converter failed:")
-    traceback.print_exc()
-
-# Test 4: network
-try:
-    from network import NetworkConnection, NetworkServer
-    print("✓ network.NetworkConnection, NetworkServer")
-except Exception as e:
-    print(f"✗ network failed:")
-    traceback.print_exc()
-
-# Test 5: terminal_ui
-try:
-    from terminal_ui import TerminalUI, InputHandler
-    print("✓ terminal_ui.TerminalUI, InputHandler")
-except Exception as e:
-    print(f"✗ terminal_ui failed:")
-    traceback.print_exc()
-
-# Test 6: session
-try:
-    from session import ChatSession
-    print("✓ session.ChatSession")
+# Imported one at a time: session pulls in the others, and concurrent
+# initialization of interdependent modules can report false failures
+results = [check(module_name, names) for module_name, names in CHECKS]
+if all(results):
     print("\n✅ All imports successful!")
-except Exception as e:
-    print(f"✗ session.ChatSession failed:")
-    traceback.print_exc()
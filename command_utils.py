@@ -4,24 +4,45 @@ Command utilities - Helper functions for commands like /manual
 import subprocess
 import platform
 import os
+import shutil
 
-def open_manual():
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
+# Default manual shipped next to this module
+MANUAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "COMMANDS.txt")
+
+# Platform, resolved once instead of per command
+_SYSTEM = platform.system()
+
+# First installed Linux terminal emulator, probed once instead of per /manual
+_LINUX_TERMINAL = next(
+    (t for t in ('gnome-terminal', 'xterm', 'konsole', 'xfce4-terminal') if shutil.which(t)),
+    None
+)
+
+
+def open_manual(manual_path=None):
     """
-    Open the COMMANDS.md manual in a separate terminal window.
+    Open the command manual in a separate terminal window.
+    
+    Args:
+        manual_path: Path to a text or markdown manual (default: COMMANDS.txt)
     
     Returns:
         True if successful, False otherwise
     """
-    # Get the path to COMMANDS.md
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    manual_path = os.path.join(script_dir, "COMMANDS.txt")
-
+    if manual_path is None:
+        manual_path = MANUAL_PATH
     
     if not os.path.exists(manual_path):
         print(f"Manual not found at: {manual_path}")
         return False
     
-    system = platform.system()
+    system = _SYSTEM
     
     try:
         if system == "Windows":
@@ -40,20 +61,15 @@ def open_manual():
             return True
         
         elif system == "Linux":
-            # Linux - try common terminal emulators
-            terminals = ['gnome-terminal', 'xterm', 'konsole', 'xfce4-terminal']
+            # Linux - use the terminal emulator found at import
+            if _LINUX_TERMINAL is None:
+                return False
             
-            for terminal in terminals:
-                try:
-                    if terminal == 'gnome-terminal':
-                        subprocess.Popen([terminal, '--', 'less', manual_path])
-                    else:
-                        subprocess.Popen([terminal, '-e', f'less {manual_path}'])
-                    return True
-                except FileNotFoundError:
-                    continue
-            
-            return False
+            if _LINUX_TERMINAL == 'gnome-terminal':
+                subprocess.Popen([_LINUX_TERMINAL, '--', 'less', manual_path])
+            else:
+                subprocess.Popen([_LINUX_TERMINAL, '-e', f'less {manual_path}'])
+            return True
         
         else:
             return False
@@ -63,25 +79,119 @@ def open_manual():
         return False
 
 
+# Win32 clipboard constants
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+
+def _set_windows_clipboard(text):
+    """Put text on the Windows clipboard through the Win32 API (no child process)."""
+    import ctypes
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GlobalAlloc.restype = ctypes.c_void_p
+    kernel32.GlobalAlloc.argtypes = [ctypes.c_uint, ctypes.c_size_t]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalFree.argtypes = [ctypes.c_void_p]
+    user32.SetClipboardData.restype = ctypes.c_void_p
+    user32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
+    
+    data = text.encode('utf-16-le') + b'\x00\x00'
+    if not user32.OpenClipboard(None):
+        raise OSError("Clipboard is in use by another application")
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(_GMEM_MOVEABLE, len(data))
+        if not handle:
+            raise MemoryError("GlobalAlloc failed")
+        ctypes.memmove(kernel32.GlobalLock(handle), data, len(data))
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(_CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            raise OSError("SetClipboardData failed")
+    finally:
+        user32.CloseClipboard()
+
+
+def _copy_with_command(command, text):
+    """Pipe text into a clipboard command-line tool."""
+    subprocess.run(command, input=text.encode('utf-8'), check=False)
+
+
+def _copy_windows(text):
+    """Copy on Windows, falling back to the clip command."""
+    try:
+        _set_windows_clipboard(text)
+    except Exception:
+        subprocess.run('clip', input=text.encode('utf-8'), shell=True, check=False)
+
+
+def _copy_mac(text):
+    """Copy on macOS."""
+    _copy_with_command(['pbcopy'], text)
+
+
+# Linux clipboard tool, probed once instead of per copy
+if shutil.which('xclip'):
+    _LINUX_CLIPBOARD = ['xclip', '-selection', 'clipboard']
+elif shutil.which('xsel'):
+    _LINUX_CLIPBOARD = ['xsel', '--clipboard', '--input']
+else:
+    _LINUX_CLIPBOARD = None
+
+
+def _copy_linux(text):
+    """Copy on Linux with pyperclip if installed, else xclip or xsel."""
+    if PYPERCLIP_AVAILABLE:
+        try:
+            pyperclip.copy(text)
+            return
+        except pyperclip.PyperclipException:
+            pass
+    if _LINUX_CLIPBOARD is None:
+        raise RuntimeError("no clipboard tool found (install xclip or xsel)")
+    _copy_with_command(_LINUX_CLIPBOARD, text)
+
+
+# Clipboard backend for this platform
+_copy_impl = {'Windows': _copy_windows, 'Darwin': _copy_mac}.get(_SYSTEM, _copy_linux)
+
+
+def copy_to_clipboard(text):
+    """
+    Copy text to the system clipboard.
+    
+    Args:
+        text: Text to copy
+    """
+    _copy_impl(text)
+
+
+# Quick help lines, built once
+_QUICK_HELP = (
+    "━━━━━━━━━ QUICK HELP ━━━━━━━━━",
+    "/copyframe - Copy current ASCII frame to clipboard",
+    "/color-mode {mode} - Change video color mode (normal, palette256, rainbow, grayscale)",
+    "/color-chat {color} - Change your chat message color",
+    "/ping {message} - Send an alert to the other user",
+    "/mute         - Toggle all sounds on/off",
+    "/togglecam    - Turn camera on/off",
+    "/togglesound  - Turn sound on/off",
+    "/manual       - Complete full documentation of Ascii Whisper in new window",
+    "/battleship   - Start Battleship game",
+    "/quit         - Exit Battleship Game (when in game)",
+    "",
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+)
+
+
 def show_quick_help():
     """
     Return quick help text for display in chat.
     
     Returns:
-        List of help message strings
+        Tuple of help message strings
     """
-    return [
-        "━━━━━━━━━ QUICK HELP ━━━━━━━━━",
-        "/copyframe - Copy current ASCII frame to clipboard",
-        "/color-mode {mode} - Change video color mode (normal, rainbow, grayscale)",
-        "/color-chat {color} - Change your chat message color",
-        "/ping {message} - Send an alert to the other user",
-        "/mute         - Toggle all sounds on/off",
-        "/togglecam    - Turn camera on/off",
-        "/togglesound  - Turn sound on/off",
-        "/manual       - Complete full documentation of Ascii Whisper in new window",
-        "/battleship   - Start Battleship game",
-        "/quit         - Exit Battleship Game (when in game)",
-        "",
-        "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-    ]
+    return _QUICK_HELP
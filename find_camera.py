@@ -1,41 +1,58 @@
 """
 Find available camera devices
 """
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 
 print("Searching for camera devices...")
 print("="*60)
 
-found_cameras = []
 
-# Try devices 0-5
-for i in range(6):
-    print(f"\nTrying device {i}...", end=" ")
-    
-    # Try with DirectShow (Windows)
-    cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
+# Capture backends to try, in order (Media Foundation and DirectShow are
+# Windows-only). MSMF comes first: its async reader drops stale frames, so
+# a probe sees the latest frame instead of a buffered one
+BACKENDS = (cv2.CAP_MSMF, cv2.CAP_DSHOW, cv2.CAP_ANY)
+
+
+def probe(i):
+    """
+    Try each backend on device i until one delivers a frame.
     
-    if cap.isOpened():
-        ret, frame = cap.read()
-        if ret and frame is not None:
-            print(f"✓ FOUND! Resolution: {frame.shape[1]}x{frame.shape[0]}")
-            found_cameras.append(i)
-        else:
-            print("✗ Opened but no frames")
-        cap.release()
-    else:
-        # Try without DirectShow
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
+    Returns:
+        (device index, resolution string or None, status message)
+    """
+    opened = False
+    for backend in BACKENDS:
+        cap = cv2.VideoCapture(i, backend)
+        try:
+            if not cap.isOpened():
+                continue
+            opened = True
+            # Don't wait for the default multi-frame buffer to fill
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             ret, frame = cap.read()
             if ret and frame is not None:
-                print(f"✓ FOUND! Resolution: {frame.shape[1]}x{frame.shape[0]}")
-                found_cameras.append(i)
-            else:
-                print("✗ Opened but no frames")
+                resolution = f"{frame.shape[1]}x{frame.shape[0]}"
+                return i, resolution, f"✓ FOUND! Resolution: {resolution}"
+        finally:
             cap.release()
-        else:
-            print("✗ Not available")
+    
+    if opened:
+        return i, None, "✗ Opened but no frames"
+    return i, None, "✗ Not available"
+
+
+# Try devices 0-5 concurrently; opening a device blocks in native code, so
+# the probes overlap instead of adding up
+with ThreadPoolExecutor(max_workers=6) as executor:
+    results = list(executor.map(probe, range(6)))
+
+found_cameras = []
+for i, resolution, message in results:
+    print(f"\nTrying device {i}... {message}")
+    if resolution:
+        found_cameras.append(i)
 
 print("\n" + "="*60)
 if found_cameras:
@@ -4,24 +4,34 @@ Generate default sound files for the chat application.
 Run this script once to create the sound files.
 """
 import wave
-import math
 import os
 import sys
 
+import numpy as np
+
 def create_beep_sound(filename, frequency, duration_ms, volume=0.5):
     """Create a simple beep WAV file."""
     sample_rate = 44100
     num_samples = int(sample_rate * duration_ms / 1000)
     
+    # Loop-invariant constants: angular step per sample and fade length
+    omega = 2 * np.pi * frequency / sample_rate
+    ramp = int(sample_rate * 0.01)
+    
     # Create audio data
-    frames = []
-    for i in range(num_samples):
-        # Generate sine wave
-        value = math.sin(2 * math.pi * frequency * i / sample_rate)
-        # Apply envelope (fade in and out)
-        envelope = min(1, i / (sample_rate * 0.01), (num_samples - i) / (sample_rate * 0.01))
-        sample = int(value * envelope * volume * 32767)
-        frames.append(sample.to_bytes(2, 'little', signed=True))
+    t = np.arange(num_samples, dtype=np.float64)
+    # Generate sine wave
+    wave_data = np.sin(omega * t)
+    # Apply envelope (fade in and out)
+    if num_samples > 2 * ramp:
+        # Trapezoid: ramp up over `ramp` samples, hold, then ramp back down
+        fade_in = np.arange(ramp, dtype=np.float64) / ramp
+        sustain = np.ones(num_samples - 2 * ramp + 1, dtype=np.float64)
+        envelope = np.concatenate([fade_in, sustain, fade_in[:0:-1]])
+    else:
+        # Too short to reach full volume: triangle clamped at 1
+        envelope = np.minimum(np.minimum(t, num_samples - t) / ramp, 1.0)
+    samples = (wave_data * envelope * volume * 32767).astype('<i2')
     
     # Write WAV file
     filepath = filename
@@ -31,7 +41,10 @@ def create_beep_sound(filename, frequency, duration_ms, volume=0.5):
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 2 bytes per sample
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(b''.join(frames))
+            # Known length up front: the header is final when written
+            wav_file.setnframes(num_samples)
+            # wave accepts any buffer, so the samples are written without a copy
+            wav_file.writeframes(samples)
         return True
     except Exception as e:
         print(f"Error creating {filename}: {e}", file=sys.stderr)
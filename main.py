@@ -8,15 +8,24 @@ Usage:
 """
 import argparse
 import sys
-from rich.console import Console
-from rich.text import Text
-from session import ChatSession
+from functools import lru_cache
 
 # imports the new sound manager library
 from sound_manager import SoundManager
 sound_manager = SoundManager()
 
-console = Console()
+# Rich is imported on first use so --help and bad arguments return quickly
+_console = None
+
+
+def get_console():
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -90,16 +99,20 @@ Controls:
     parser.add_argument(
         '--color',
         type=str,
-        choices=['rainbow', 'bw', 'normal', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan', 'white', 'black'],
+        choices=['rainbow', 'bw', 'normal', 'palette256', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan', 'white', 'black'],
         default='rainbow',
-        help='Color mode: rainbow (heatmap), bw (black/white), normal (original colors), or solid colors. Default: rainbow'
+        help='Color mode: rainbow (heatmap), bw (black/white), normal (original colors), palette256 (original colors, 256-color terminals), or solid colors. Default: rainbow'
     )
     
     return parser.parse_args()
 
 
-def print_banner():
-    """Print ASCII art banner with gradient effect."""
+@lru_cache(maxsize=1)
+def _build_banner():
+    """Build the ASCII art banner with its gradient applied (once)."""
+    import numpy as np
+    from rich.text import Text
+    
     banner = r"""
                                                                            
      .oo .oPYo. .oPYo. o o   o      o 8       o                            
@@ -117,10 +130,6 @@ def print_banner():
     # Create gradient from yellow → lime → blue → purple → magenta
     text = Text(banner)
     
-    # Calculate gradient steps
-    lines = banner.split('\n')
-    total_chars = sum(len(line) for line in lines)
-    
     # Define gradient colors (hex format)
     colors = [
         "#FFFF00",  # Yellow
@@ -134,23 +143,31 @@ def print_banner():
         "#FF00FF",  # Magenta
     ]
     
-    # Apply gradient character by character
-    char_index = 0
-    for line_num, line in enumerate(lines):
-        for char_pos, char in enumerate(line):
-            if char.strip():  # Only color non-whitespace
-                # Calculate which color to use based on position
-                progress = char_index / max(total_chars - 1, 1)
-                color_idx = int(progress * (len(colors) - 1))
-                color_idx = min(color_idx, len(colors) - 1)
-                
-                # Calculate position in output
-                offset = sum(len(lines[i]) + 1 for i in range(line_num)) + char_pos
-                text.stylize(colors[color_idx], offset, offset + 1)
-            
-            char_index += 1
-    
-    console.print(text)
+    # Gradient position of each character, counting every character except
+    # newlines; the color index only moves forward, so every color covers one
+    # contiguous span and needs a single stylize call (whitespace in between
+    # stays invisible)
+    codes = np.frombuffer(banner.encode('utf-32-le'), dtype=np.uint32)
+    is_newline = codes == ord('\n')
+    char_index = np.arange(len(codes)) - np.cumsum(is_newline)
+    total_chars = len(codes) - int(is_newline.sum())
+    color_idx = np.minimum(char_index * (len(colors) - 1) // max(total_chars - 1, 1), len(colors) - 1)
+    
+    # Only color non-whitespace (the banner is plain ASCII)
+    offsets = np.flatnonzero(codes > ord(' '))
+    offset_colors = color_idx[offsets]
+    for color in np.unique(offset_colors):
+        first = np.searchsorted(offset_colors, color, side='left')
+        last = np.searchsorted(offset_colors, color, side='right') - 1
+        text.stylize(colors[color], int(offsets[first]), int(offsets[last]) + 1)
+    
+    return text
+
+
+def print_banner():
+    """Print ASCII art banner with gradient effect."""
+    console = get_console()
+    console.print(_build_banner())
     console.print("[bold cyan]Real-time P2P Video Chat with ASCII Art - v2.0[/bold cyan]")
     console.print("=" * 80)
     print()
@@ -181,6 +198,7 @@ def validate_settings(args):
 
 def ask_color_mode():
     """Ask user for color mode preference."""
+    console = get_console()
     console.print("\n[bold]Color Mode Options:[/bold]")
     console.print("  [yellow]1.[/yellow] Rainbow Heatmap (colorful, brightness-based)")
     console.print("  [white]2.[/white] Black & White (classic ASCII)")
@@ -224,6 +242,7 @@ def ask_color_mode():
 
 def ask_chat_color():
     """Ask user for their chat message color."""
+    console = get_console()
     console.print("\n[bold]Chat Color Options:[/bold]")
     console.print("  1. Red")
     console.print("  2. Green")
@@ -253,6 +272,7 @@ def ask_chat_color():
 
 def ask_theme_color():
     """Ask user for their video frame theme color."""
+    console = get_console()
     console.print("\n[bold]Video Frame Theme:[/bold]")
     console.print("  1. Green")
     console.print("  2. Blue")
@@ -278,14 +298,28 @@ def ask_theme_color():
 
 
 def main():
-    """Main entry point."""    
-    print_banner()    
-    
-    # Parse arguments
+    """Main entry point."""
+    # Parse and validate arguments before any heavy imports or prompts
     args = parse_args()
     
+    errors = validate_settings(args)
+    if errors:
+        console = get_console()
+        console.print("[bold red]ERROR: Invalid settings:[/bold red]")
+        for error in errors:
+            console.print(f"  [red]- {error}[/red]")
+        sys.exit(1)
+    
+    from rich.text import Text
+    from session import ChatSession
+    from video_capture import prewarm
+    from ascii_converter import prewarm_kernels
+    
+    console = get_console()
+    print_banner()
+    
     # Ask for color mode if not specified
-    if '--color' not in ' '.join(__import__('sys').argv):
+    if not any(arg == '--color' or arg.startswith('--color=') for arg in sys.argv):
         args.color = ask_color_mode()
         print()
     
@@ -295,37 +329,40 @@ def main():
     theme_color = ask_theme_color()
     print()
     
-    # Validate settings
-    errors = validate_settings(args)
-    if errors:
-        console.print("[bold red]ERROR: Invalid settings:[/bold red]")
-        for error in errors:
-            console.print(f"  [red]- {error}[/red]")
-        sys.exit(1)
-    
-    # Determine mode
+    # Determine mode; the settings summary is built as one Text and printed once
     if args.host:
         mode = 'host'
         remote_host = None
-        console.print(f"[bold green]Mode:[/bold green] HOST")
-        console.print(f"[yellow]Listening on:[/yellow] {args.bind}:{args.port}")
-        console.print(f"[yellow]Share your IP with your peer so they can connect[/yellow]")
+        summary = [
+            Text.assemble(("Mode:", "bold green"), " HOST"),
+            Text.assemble(("Listening on:", "yellow"), f" {args.bind}:{args.port}"),
+            Text("Share your IP with your peer so they can connect", style="yellow"),
+        ]
     else:
         mode = 'connect'
         remote_host = args.connect
-        console.print(f"[bold green]Mode:[/bold green] CONNECT")
-        console.print(f"[yellow]Connecting to:[/yellow] {remote_host}:{args.port}")
+        summary = [
+            Text.assemble(("Mode:", "bold green"), " CONNECT"),
+            Text.assemble(("Connecting to:", "yellow"), f" {remote_host}:{args.port}"),
+        ]
     
-    console.print(f"[cyan]Camera device:[/cyan] {args.device}")
+    summary.append(Text.assemble(("Camera device:", "cyan"), f" {args.device}"))
     if args.width:
-        console.print(f"[cyan]ASCII width:[/cyan] {args.width} characters (manual)")
+        summary.append(Text.assemble(("ASCII width:", "cyan"), f" {args.width} characters (manual)"))
     else:
-        console.print(f"[cyan]ASCII width:[/cyan] Auto-detect from terminal size")
-    console.print(f"[cyan]Color mode:[/cyan] {args.color}")
+        summary.append(Text.assemble(("ASCII width:", "cyan"), " Auto-detect from terminal size"))
+    summary.append(Text.assemble(("Color mode:", "cyan"), f" {args.color}"))
+    # Highlight numbers and addresses as console.print does for plain strings
+    console.print(console.highlighter(Text("\n").join(summary)))
     print()
     console.print("[bold]Starting in 2 seconds... (Ctrl+C to cancel)[/bold]")
     print()
     
+    # Open the camera and compile the ASCII kernels during the countdown
+    # instead of after it
+    prewarm(args.device, fps_target=15)
+    prewarm_kernels()
+    
     import time
     time.sleep(2)
     
@@ -1,13 +1,132 @@
 """
 Network - TCP socket implementation for P2P communication
 """
+import heapq
+import itertools
+import selectors
 import socket
 import threading
 import time
+from collections import deque
 from queue import Queue, Empty
-from protocol import (Protocol, HEADER_SIZE, MSG_VIDEO_FRAME, MSG_TEXT_MESSAGE, MSG_HEARTBEAT, MSG_USER_INFO,
-                      MSG_BATTLESHIP_INVITE, MSG_BATTLESHIP_ACCEPT, MSG_BATTLESHIP_SHIP_PLACEMENT,
-                      MSG_BATTLESHIP_MOVE, MSG_BATTLESHIP_RESULT, MSG_BATTLESHIP_QUIT, MSG_AI_COMMENT)
+from protocol import (Protocol, HEADER_SIZE, CODEC_ZLIB, MSG_VIDEO_FRAME, MSG_VIDEO_DELTA, MSG_TEXT_MESSAGE,
+                      MSG_HEARTBEAT, MSG_USER_INFO, MSG_BATTLESHIP_INVITE, MSG_BATTLESHIP_ACCEPT,
+                      MSG_BATTLESHIP_SHIP_PLACEMENT, MSG_BATTLESHIP_MOVE, MSG_BATTLESHIP_RESULT,
+                      MSG_BATTLESHIP_QUIT, MSG_AI_COMMENT)
+
+
+# Scatter-gather sends aren't available on Windows
+HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# Kernel socket buffer sizes. The receive side is large so full video frames
+# fit in the TCP window; the send side stays moderate so that under back-pressure
+# frames wait in our queue (where they can be dropped) rather than the kernel's.
+RECV_BUFFER_SIZE = 4 << 20
+SEND_BUFFER_SIZE = 512 << 10
+
+# How far ahead of received data the receive buffer may grow for a partial message
+RECV_READ_AHEAD = 256 << 10
+
+
+def _set_buffer_sizes(sock):
+    """Size a socket's kernel buffers (call before connect/listen so the TCP window can use them)."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+
+
+class Reactor:
+    """
+    One background thread that receives for every connection and runs their
+    timers (heartbeats), instead of a receive and a heartbeat thread per
+    connection.
+    
+    Sockets are watched with a selector (epoll/kqueue/select). Registrations
+    and timers requested from other threads are queued and applied by the
+    reactor thread itself, which a wake-up socket pair interrupts.
+    """
+    
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._timers = []  # Heap of (deadline, sequence, callback)
+        self._sequence = itertools.count()
+        self._pending = deque()  # Callables to run on the reactor thread
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._selector.register(self._wake_recv, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def register(self, sock, on_readable):
+        """Call on_readable() on the reactor thread whenever sock has data."""
+        self._call_soon(lambda: self._selector.register(sock, selectors.EVENT_READ, on_readable))
+    
+    def unregister(self, sock):
+        """Stop watching sock (safe to call more than once, or after closing it)."""
+        def remove():
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+        self._call_soon(remove)
+    
+    def call_later(self, delay, callback):
+        """Call callback() on the reactor thread after delay seconds."""
+        deadline = time.monotonic() + delay
+        self._call_soon(lambda: heapq.heappush(self._timers, (deadline, next(self._sequence), callback)))
+    
+    def _call_soon(self, callback):
+        """Queue callback for the reactor thread and wake it."""
+        self._pending.append(callback)
+        try:
+            self._wake_send.send(b'\0')
+        except BlockingIOError:
+            pass  # Already plenty of wake-ups queued
+    
+    def _run(self):
+        """Reactor thread: dispatch readable sockets and due timers forever."""
+        while True:
+            while self._pending:
+                self._dispatch(self._pending.popleft())
+            
+            timeout = None
+            if self._timers:
+                timeout = max(0.0, self._timers[0][0] - time.monotonic())
+            
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    # Wake-up bytes; the pending work runs at the top of the loop
+                    try:
+                        self._wake_recv.recv(4096)
+                    except BlockingIOError:
+                        pass
+                    continue
+                self._dispatch(key.data)
+            
+            now = time.monotonic()
+            while self._timers and self._timers[0][0] <= now:
+                self._dispatch(heapq.heappop(self._timers)[2])
+    
+    @staticmethod
+    def _dispatch(callback):
+        """Run a callback without letting its errors stop the reactor."""
+        try:
+            callback()
+        except Exception as e:
+            print(f"Reactor callback error: {e}")
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+
+
+def get_reactor():
+    """Return the shared Reactor, starting it on first use."""
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = Reactor()
+        return _reactor
 
 
 class NetworkConnection:
@@ -21,21 +140,70 @@ class NetworkConnection:
             sock: Existing socket (for accepted connections)
         """
         self.sock = sock
+        # Plain flags, safe to read from any thread; connected only goes
+        # False -> True on connect and back once, on disconnect or close
         self.connected = False
         self.running = False
         
         # Receive queues for different message types
-        self.video_queue = Queue(maxsize=5)  # Keep only recent frames
+        # Video frames: one producer (receive thread) and one consumer, so a
+        # bounded deque (which drops the oldest frame when full) and an Event
+        # are enough, without Queue's lock and condition traffic per frame
+        self.video_frames = deque(maxlen=5)  # Keep only recent frames
+        self._video_ready = threading.Event()
         self.text_queue = Queue()
         self.user_info_queue = Queue()
         self.battleship_queue = Queue()  # For all battleship messages
         self.ai_queue = Queue()  # For AI commentary
         
-        # Threads
-        self.receive_thread = None
-        self.heartbeat_thread = None
+        # Set after anything is queued (or the connection drops) so one
+        # consumer can wait on all queues at once; see get_next
+        self._rx_ready = threading.Event()
+        self._rx_queues = (('text', self.text_queue), ('user_info', self.user_info_queue),
+                           ('battleship', self.battleship_queue), ('ai', self.ai_queue))
+        
+        # Video codec, upgraded once the peer's user info lists what it supports
+        self.video_codec = CODEC_ZLIB
+        self._video_compressor = Protocol.create_video_compressor()
+        self._video_decompressor = Protocol.create_video_decompressor()
+        
+        # Last video frame (UTF-8) sent and received, the reference for deltas
+        self._last_tx_frame = b''
+        self._last_rx_frame = b''
+        self._deltas_since_keyframe = 0
+        self.keyframe_interval = 30  # Send a full frame at least this often
+        
+        # Reusable receive buffer; bytes between _read_pos and _write_pos are
+        # pending. See _on_readable.
+        self._rxbuf = bytearray(131072)
+        self._read_pos = 0
+        self._write_pos = 0
+        
+        # Message handlers by type
+        self._handlers = {
+            MSG_VIDEO_FRAME: self._handle_video,
+            MSG_VIDEO_DELTA: self._handle_video,
+            MSG_TEXT_MESSAGE: self._handle_text,
+            MSG_HEARTBEAT: self._handle_heartbeat,
+            MSG_USER_INFO: self._handle_user_info,
+            MSG_AI_COMMENT: self._handle_ai_comment,
+        }
+        for msg_type in (MSG_BATTLESHIP_INVITE, MSG_BATTLESHIP_ACCEPT, MSG_BATTLESHIP_SHIP_PLACEMENT,
+                         MSG_BATTLESHIP_MOVE, MSG_BATTLESHIP_RESULT, MSG_BATTLESHIP_QUIT):
+            self._handlers[msg_type] = self._handle_battleship
+        
+        # Outgoing video: the newest frame waiting for the send thread. Sends of
+        # any kind are serialized by the lock so messages never interleave.
+        self._tx_video = deque(maxlen=1)
+        self._tx_ready = threading.Event()
+        self._send_lock = threading.Lock()
+        
+        # Receiving and heartbeats run on the shared reactor thread; each
+        # connection only has its own thread for (possibly blocking) sends
+        self.send_thread = None
         
         # Heartbeat
+        self._heartbeat_due = False
         self.last_heartbeat = time.time()
         self.heartbeat_interval = 5.0
         self.heartbeat_timeout = 15.0
@@ -54,9 +222,11 @@ class NetworkConnection:
         """
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            _set_buffer_sizes(self.sock)
             self.sock.settimeout(timeout)
             self.sock.connect((host, port))
             self.sock.settimeout(None)  # Remove timeout after connection
+            self._configure_socket()
             self.connected = True
             self._start_threads()
             return True
@@ -67,117 +237,179 @@ class NetworkConnection:
     def start_as_accepted(self):
         """Start connection for an accepted socket."""
         if self.sock:
+            self._configure_socket()
             self.connected = True
             self._start_threads()
     
+    def _configure_socket(self):
+        """Apply socket options for a freshly connected socket."""
+        if self.sock.family in (socket.AF_INET, socket.AF_INET6):
+            # Don't hold back small text/heartbeat messages waiting for ACKs
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            _set_buffer_sizes(self.sock)
+    
     def _start_threads(self):
-        """Start receive and heartbeat threads."""
+        """Start the send thread and hand receiving and heartbeats to the reactor."""
         self.running = True
         
-        self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
-        self.receive_thread.start()
+        self.send_thread = threading.Thread(target=self._send_loop, daemon=True)
+        self.send_thread.start()
         
-        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
-        self.heartbeat_thread.start()
+        reactor = get_reactor()
+        reactor.register(self.sock, self._on_readable)
+        reactor.call_later(0, self._on_heartbeat_timer)
+    
+    def _disconnect(self):
+        """Mark the connection lost and stop watching its socket."""
+        self.connected = False
+        self._tx_ready.set()  # Wake the send thread so it exits
+        self._rx_ready.set()  # And any get_next() waiter
+        get_reactor().unregister(self.sock)
     
-    def _receive_loop(self):
-        """Background thread to receive messages."""
-        buffer = b''
+    def _on_readable(self):
+        """Reactor callback: receive what's available and handle complete messages."""
+        if not (self.running and self.connected):
+            get_reactor().unregister(self.sock)
+            return
         
-        while self.running and self.connected:
-            try:
-                # Receive data
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    # Connection closed
-                    self.connected = False
-                    break
-                
-                buffer += chunk
-                
-                # Process complete messages in buffer
-                while len(buffer) >= HEADER_SIZE:
-                    # Parse header
-                    msg_type, payload_length = Protocol.decode_header(buffer[:HEADER_SIZE])
-                    
-                    # Check if we have the full message
-                    total_length = HEADER_SIZE + payload_length
-                    if len(buffer) < total_length:
-                        break  # Wait for more data
-                    
-                    # Extract payload
-                    payload = buffer[HEADER_SIZE:total_length]
-                    buffer = buffer[total_length:]  # Remove processed message
-                    
-                    # Handle message based on type
-                    self._handle_message(msg_type, payload)
-                    
-            except Exception as e:
-                if self.running:
-                    print(f"Receive error: {e}")
-                self.connected = False
-                break
+        # Data is received straight into self._rxbuf. Consumed bytes are only
+        # dropped once _read_pos passes a high-water mark, so a frame split
+        # across many TCP segments isn't copied again for every segment.
+        read_pos = self._read_pos
+        write_pos = self._write_pos
+        try:
+            # Grow the buffer if a large frame has filled it
+            if write_pos == len(self._rxbuf):
+                self._rxbuf.extend(bytes(len(self._rxbuf)))
+            
+            # Receive data
+            with memoryview(self._rxbuf) as view:
+                n = self.sock.recv_into(view[write_pos:])
+        except Exception as e:
+            if self.running:
+                print(f"Receive error: {e}")
+            self._disconnect()
+            return
+        
+        if not n:
+            # Connection closed
+            self._disconnect()
+            return
+        
+        write_pos += n
+        
+        # Process complete messages in buffer
+        while write_pos - read_pos >= HEADER_SIZE:
+            # Parse header
+            msg_type, payload_length, checksum = Protocol.decode_header(self._rxbuf, read_pos)
+            
+            # Check if we have the full message
+            start = read_pos + HEADER_SIZE
+            end = start + payload_length
+            if write_pos < end:
+                # Make room for the rest of this message (up to a cap, in
+                # case the length is bogus) so it arrives in one read
+                wanted = min(end, write_pos + RECV_READ_AHEAD)
+                if wanted > len(self._rxbuf):
+                    self._rxbuf.extend(bytes(wanted - len(self._rxbuf)))
+                break  # Wait for more data
+            
+            # Extract payload
+            with memoryview(self._rxbuf) as view:
+                payload = bytes(view[start:end])
+            read_pos = end
+            
+            # Handle message based on type, dropping it if it was corrupted on the way
+            if Protocol.payload_checksum(payload) == checksum:
+                self._handle_message(msg_type, payload)
+            else:
+                print(f"Dropped message type 0x{msg_type:02x}: checksum mismatch")
+                if msg_type in (MSG_VIDEO_FRAME, MSG_VIDEO_DELTA):
+                    # Later deltas (and stream history) depend on it; wait for a keyframe
+                    self._last_rx_frame = b''
+        
+        # Compact the buffer
+        if read_pos == write_pos:
+            read_pos = write_pos = 0
+        elif read_pos > 65536:
+            del self._rxbuf[:read_pos]
+            write_pos -= read_pos
+            read_pos = 0
+            if len(self._rxbuf) < 131072:
+                self._rxbuf.extend(bytes(131072 - len(self._rxbuf)))
+        
+        self._read_pos = read_pos
+        self._write_pos = write_pos
     
     def _handle_message(self, msg_type, payload):
         """Handle received message based on type."""
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            return
         try:
-            if msg_type == MSG_VIDEO_FRAME:
-                # Decompress and queue video frame
-                ascii_frame = Protocol.decompress_ascii(payload)
-                
-                # Drop old frames if queue is full
-                if self.video_queue.full():
-                    try:
-                        self.video_queue.get_nowait()
-                    except Empty:
-                        pass
-                
-                self.video_queue.put(ascii_frame)
-                
-            elif msg_type == MSG_TEXT_MESSAGE:
-                # Queue text message
-                text = payload.decode('utf-8')
-                self.text_queue.put(text)
-                
-            elif msg_type == MSG_HEARTBEAT:
-                # Update heartbeat timestamp
-                self.last_heartbeat = time.time()
-                
-            elif msg_type == MSG_USER_INFO:
-                # Queue user info
-                self.user_info_queue.put(payload)
-            
-            elif msg_type in [MSG_BATTLESHIP_INVITE, MSG_BATTLESHIP_ACCEPT, MSG_BATTLESHIP_SHIP_PLACEMENT,
-                             MSG_BATTLESHIP_MOVE, MSG_BATTLESHIP_RESULT, MSG_BATTLESHIP_QUIT]:
-                # Queue battleship messages with type
-                self.battleship_queue.put((msg_type, payload))
-            
-            elif msg_type == MSG_AI_COMMENT:
-                # Queue AI commentary
-                self.ai_queue.put(payload)
-                
+            handler(msg_type, payload)
+            self._rx_ready.set()
         except Exception as e:
             print(f"Error handling message type 0x{msg_type:02x}: {e}")
     
-    def _heartbeat_loop(self):
-        """Send periodic heartbeats and check for timeouts."""
-        while self.running and self.connected:
-            try:
-                # Send heartbeat
-                self.send_heartbeat()
-                
-                # Check for timeout
-                if time.time() - self.last_heartbeat > self.heartbeat_timeout:
-                    print("Connection timeout - no heartbeat received")
-                    self.connected = False
-                    break
-                
-                time.sleep(self.heartbeat_interval)
-                
-            except Exception as e:
-                if self.running:
-                    print(f"Heartbeat error: {e}")
-                break
+    def _handle_video(self, msg_type, payload):
+        """Decompress (and undo the delta) then queue video frame."""
+        try:
+            if msg_type == MSG_VIDEO_FRAME:
+                # Keyframes start a fresh compression stream: a resync point
+                # after a lost or undecodable message
+                self._video_decompressor = Protocol.create_video_decompressor()
+                frame_bytes = Protocol.parse_video_keyframe(payload, self._video_decompressor)
+            elif not self._last_rx_frame:
+                return  # No reference to apply the delta to until the next keyframe
+            else:
+                frame_bytes = Protocol.parse_video_delta(payload, self._last_rx_frame,
+                                                         self._video_decompressor)
+        except Exception:
+            self._last_rx_frame = b''
+            raise
+        self._last_rx_frame = frame_bytes
+        
+        # Queue the frame (the oldest is dropped if full)
+        self.video_frames.append(frame_bytes.decode('utf-8'))
+        self._video_ready.set()
+    
+    def _handle_text(self, msg_type, payload):
+        """Queue text message."""
+        self.text_queue.put(payload.decode('utf-8'))
+    
+    def _handle_heartbeat(self, msg_type, payload):
+        """Update heartbeat timestamp."""
+        self.last_heartbeat = time.time()
+    
+    def _handle_user_info(self, msg_type, payload):
+        """Pick the video codec and queue user info."""
+        self.video_codec = Protocol.choose_video_codec(payload)
+        self.user_info_queue.put(payload)
+    
+    def _handle_battleship(self, msg_type, payload):
+        """Queue battleship messages with type."""
+        self.battleship_queue.put((msg_type, payload))
+    
+    def _handle_ai_comment(self, msg_type, payload):
+        """Queue AI commentary."""
+        self.ai_queue.put(payload)
+    
+    def _on_heartbeat_timer(self):
+        """Reactor timer: request a heartbeat and check for timeouts."""
+        if not (self.running and self.connected):
+            return
+        
+        # Check for timeout
+        if time.time() - self.last_heartbeat > self.heartbeat_timeout:
+            print("Connection timeout - no heartbeat received")
+            self._disconnect()
+            return
+        
+        # The send thread sends it, so the reactor never blocks on a full socket
+        self._heartbeat_due = True
+        self._tx_ready.set()
+        get_reactor().call_later(self.heartbeat_interval, self._on_heartbeat_timer)
     
     def send(self, data):
         """Send raw data."""
@@ -185,22 +417,91 @@ class NetworkConnection:
             return False
         
         try:
-            self.sock.sendall(data)
+            with self._send_lock:
+                self.sock.sendall(data)
+            return True
+        except Exception as e:
+            print(f"Send error: {e}")
+            self._disconnect()
+            return False
+    
+    def send_parts(self, parts):
+        """Send a message given as a list of buffers, without joining them."""
+        if not self.connected:
+            return False
+        
+        try:
+            with self._send_lock:
+                if not HAS_SENDMSG:
+                    self.sock.sendall(b''.join(parts))
+                    return True
+                
+                views = [memoryview(part) for part in parts if len(part)]
+                while views:
+                    sent = self.sock.sendmsg(views)
+                    # Drop fully sent buffers and trim a partially sent one
+                    while views and sent >= len(views[0]):
+                        sent -= len(views[0])
+                        views.pop(0)
+                    if sent:
+                        views[0] = views[0][sent:]
             return True
         except Exception as e:
             print(f"Send error: {e}")
-            self.connected = False
+            self._disconnect()
             return False
     
     def send_video_frame(self, ascii_frame):
-        """Send a video frame."""
-        msg = Protocol.create_video_message(ascii_frame)
-        return self.send(msg)
+        """
+        Queue a video frame for the send thread.
+        
+        Returns immediately. If the network can't keep up, a frame still waiting
+        when the next one arrives is replaced by it, so the camera loop never
+        blocks on a full socket and the peer always gets the newest frame.
+        """
+        if not self.connected:
+            return False
+        self._tx_video.append(ascii_frame)
+        self._tx_ready.set()
+        return True
+    
+    def _send_loop(self):
+        """Background thread sending heartbeats and the newest queued video frame."""
+        while self.running and self.connected:
+            self._tx_ready.wait(0.5)
+            self._tx_ready.clear()
+            if self._heartbeat_due:
+                self._heartbeat_due = False
+                self.send_heartbeat()
+            try:
+                ascii_frame = self._tx_video.popleft()
+            except IndexError:
+                continue
+            self._send_video_now(ascii_frame)
+    
+    def _send_video_now(self, ascii_frame):
+        """Send a video frame, as a delta against the last one when possible."""
+        # Frames are only encoded here, once they are certain to be sent, so
+        # dropped frames never enter the delta reference or compressor state
+        frame_bytes = ascii_frame.encode('utf-8')
+        if (len(frame_bytes) == len(self._last_tx_frame)
+                and self._deltas_since_keyframe < self.keyframe_interval):
+            msg = Protocol.create_video_delta(frame_bytes, self._last_tx_frame,
+                                              self.video_codec, self._video_compressor)
+            self._deltas_since_keyframe += 1
+        else:
+            # Keyframes start a fresh stream so the peer can resync on them
+            self._video_compressor = Protocol.create_video_compressor()
+            msg = Protocol.create_video_keyframe(frame_bytes, self.video_codec, self._video_compressor)
+            self._deltas_since_keyframe = 0
+        self._last_tx_frame = frame_bytes
+        return self.send_parts(msg)
     
     def send_text(self, text):
         """Send a text message."""
-        msg = Protocol.create_text_message(text)
-        return self.send(msg)
+        # Header and payload go out as separate buffers instead of being joined
+        parts = Protocol.encode_message_parts(MSG_TEXT_MESSAGE, text.encode('utf-8'))
+        return self.send_parts(parts)
     
     def send_heartbeat(self):
         """Send a heartbeat message."""
@@ -227,8 +528,50 @@ class NetworkConnection:
             ASCII frame string or None
         """
         try:
-            return self.video_queue.get(timeout=timeout)
-        except Empty:
+            return self.video_frames.popleft()
+        except IndexError:
+            pass
+        
+        # Clear before re-checking so a frame queued in between still wakes us
+        self._video_ready.clear()
+        if not self.video_frames:
+            self._video_ready.wait(timeout)
+        
+        try:
+            return self.video_frames.popleft()
+        except IndexError:
+            return None
+    
+    def get_next(self, timeout=0.1):
+        """
+        Get the next received message of any kind, waiting on all queues at once.
+        
+        Chat, user info, battleship and AI messages are returned before
+        queued video frames.
+        
+        Returns:
+            Tuple of (kind, item) with kind 'text', 'user_info', 'battleship',
+            'ai' or 'video' and item as from the matching get_* method, or None
+        """
+        item = self._poll_next()
+        if item is None:
+            # Clear before re-checking so a message queued in between still wakes us
+            self._rx_ready.clear()
+            item = self._poll_next()
+            if item is None and self._rx_ready.wait(timeout):
+                item = self._poll_next()
+        return item
+    
+    def _poll_next(self):
+        """Pop the next queued message without waiting, or return None."""
+        for kind, queue in self._rx_queues:
+            try:
+                return kind, queue.get_nowait()
+            except Empty:
+                pass
+        try:
+            return 'video', self.video_frames.popleft()
+        except IndexError:
             return None
     
     def get_text_message(self, timeout=0.1):
@@ -271,8 +614,11 @@ class NetworkConnection:
         """Close the connection."""
         self.running = False
         self.connected = False
+        self._tx_ready.set()  # Wake the send thread so it exits
+        self._rx_ready.set()
         
         if self.sock:
+            get_reactor().unregister(self.sock)
             try:
                 self.sock.close()
             except:
@@ -303,6 +649,7 @@ class NetworkServer:
         """Start listening for connections."""
         self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        _set_buffer_sizes(self.server_sock)  # Inherited by accepted sockets
         self.server_sock.bind((self.host, self.port))
         self.server_sock.listen(1)
         return True
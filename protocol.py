@@ -1,8 +1,18 @@
 """
 Protocol - Message framing and serialization
 """
+import json
 import struct
+import threading
 import zlib
+import numpy as np
+from battleship import BattleshipGame
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
 
 
 # Message types
@@ -17,9 +27,31 @@ MSG_BATTLESHIP_MOVE = 0x08
 MSG_BATTLESHIP_RESULT = 0x09
 MSG_BATTLESHIP_QUIT = 0x0A
 MSG_AI_COMMENT = 0x0B  # AI commentary message
+MSG_VIDEO_DELTA = 0x0C  # Video frame XORed with the previous one
 
 # Protocol constants
-HEADER_SIZE = 5  # 1 byte type + 4 bytes length
+_HDR = struct.Struct('!BII')  # 1 byte type + 4 bytes length + 4 bytes CRC32 of payload (big-endian)
+HEADER_SIZE = _HDR.size
+
+# Video frame codecs (first byte of every video frame payload)
+CODEC_ZLIB = 0x00
+CODEC_LZ4 = 0x01
+CODEC_ZLIB_STREAM = 0x02  # One deflate stream per connection, sync-flushed per frame
+SUPPORTED_CODECS = ((CODEC_LZ4,) if LZ4_AVAILABLE else ()) + (CODEC_ZLIB_STREAM, CODEC_ZLIB)
+
+# Battleship payload layouts
+_ACCEPT = struct.Struct('!?')
+_MOVE = struct.Struct('!BB')  # row, col
+_DICE_ROLL_ROW = 0xFF  # Move row marking a setup dice roll (roll in the col byte)
+_RESULT = struct.Struct('!B16p')  # result code, ship name
+_RESULT_CODES = ("miss", "hit", "sunk", "already_attacked", "invalid")
+_PLACEMENT = struct.Struct('!BBB?')  # row, col, size, is_horizontal
+
+# Heartbeats have no payload, so the whole message is a constant
+_HEARTBEAT = _HDR.pack(MSG_HEARTBEAT, 0, zlib.crc32(b''))
+
+# Per-thread buffer that outgoing video deltas are built in
+_delta_scratch = threading.local()
 
 
 class Protocol:
@@ -28,7 +60,7 @@ class Protocol:
     @staticmethod
     def encode_message(msg_type, payload):
         """
-        Encode a message with type and length header.
+        Encode a message with type, length and checksum header.
         
         Args:
             msg_type: Message type byte (MSG_VIDEO_FRAME, MSG_TEXT_MESSAGE, etc.)
@@ -37,63 +69,176 @@ class Protocol:
         Returns:
             Bytes: Encoded message with header
         """
-        if isinstance(payload, str):
-            payload = payload.encode('utf-8')
-        
         payload_length = len(payload)
         
-        # Pack: 1 byte type + 4 bytes length (big-endian) + payload
-        header = struct.pack('!BI', msg_type, payload_length)
+        # Pack: 1 byte type + 4 bytes length + 4 bytes CRC32 (big-endian) + payload
+        header = _HDR.pack(msg_type, payload_length, zlib.crc32(payload))
         return header + payload
     
     @staticmethod
-    def decode_header(header_bytes):
+    def encode_message_parts(msg_type, *parts):
+        """
+        Encode a message whose payload is split across several buffers.
+        
+        The parts are not joined, so the caller can hand them to the socket
+        in one scatter-gather send without copying the payload again.
+        
+        Returns:
+            List of buffers: header followed by the payload parts
+        """
+        payload_length = 0
+        checksum = 0
+        for part in parts:
+            payload_length += len(part)
+            checksum = zlib.crc32(part, checksum)
+        return [_HDR.pack(msg_type, payload_length, checksum), *parts]
+    
+    @staticmethod
+    def decode_header(header_bytes, offset=0):
         """
         Decode message header.
         
         Args:
-            header_bytes: 5 bytes containing type and length
+            header_bytes: Buffer containing type, length and checksum
+            offset: Position of the header within header_bytes
             
         Returns:
-            Tuple of (msg_type, payload_length)
+            Tuple of (msg_type, payload_length, checksum)
         """
-        if len(header_bytes) < HEADER_SIZE:
-            raise ValueError(f"Header too short: {len(header_bytes)} bytes")
+        if len(header_bytes) - offset < HEADER_SIZE:
+            raise ValueError(f"Header too short: {len(header_bytes) - offset} bytes")
         
-        msg_type, payload_length = struct.unpack('!BI', header_bytes)
-        return msg_type, payload_length
+        return _HDR.unpack_from(header_bytes, offset)
     
     @staticmethod
-    def compress_ascii(ascii_string):
+    def payload_checksum(payload):
+        """CRC32 of a payload, as carried in the message header."""
+        return zlib.crc32(payload)
+    
+    @staticmethod
+    def compress_frame_parts(frame_bytes, codec=CODEC_ZLIB, stream=None):
         """
-        Compress ASCII art string.
+        Compress an encoded video frame (or frame delta).
         
         Args:
-            ascii_string: ASCII art string
+            frame_bytes: Bytes-like object to compress
+            codec: CODEC_ZLIB, CODEC_ZLIB_STREAM or CODEC_LZ4
+            stream: Compressor from create_video_compressor (CODEC_ZLIB_STREAM)
             
         Returns:
-            Compressed bytes
+            Tuple of compressed buffers, to be sent back to back
         """
-        return zlib.compress(ascii_string.encode('utf-8'), level=6)
+        if codec == CODEC_ZLIB_STREAM:
+            # Later frames can reference earlier ones through the shared window.
+            # The two outputs are sent as separate buffers rather than joined.
+            return stream.compress(frame_bytes), stream.flush(zlib.Z_SYNC_FLUSH)
+        if codec == CODEC_LZ4:
+            return (lz4.frame.compress(frame_bytes),)
+        # Level 1 is several times faster than the default on ASCII frames
+        # and only a few percent larger
+        return (zlib.compress(frame_bytes, level=1),)
+    
+    @staticmethod
+    def compress_frame(frame_bytes, codec=CODEC_ZLIB, stream=None):
+        """Compress an encoded video frame into a single bytes object."""
+        return b''.join(Protocol.compress_frame_parts(frame_bytes, codec, stream))
     
     @staticmethod
-    def decompress_ascii(compressed_bytes):
+    def decompress_frame(compressed_bytes, codec=CODEC_ZLIB, stream=None):
         """
-        Decompress ASCII art string.
+        Decompress an encoded video frame (or frame delta).
         
         Args:
             compressed_bytes: Compressed data
+            codec: Codec the data was compressed with
+            stream: Decompressor from create_video_decompressor (CODEC_ZLIB_STREAM)
             
         Returns:
-            Decompressed ASCII string
+            Decompressed bytes
+        """
+        if codec == CODEC_ZLIB_STREAM:
+            return stream.decompress(compressed_bytes)
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(compressed_bytes)
+        if codec == CODEC_LZ4 and LZ4_AVAILABLE:
+            return lz4.frame.decompress(compressed_bytes)
+        raise ValueError(f"Unsupported video codec: 0x{codec:02x}")
+    
+    @staticmethod
+    def compress_ascii(ascii_string, codec=CODEC_ZLIB, stream=None):
+        """Compress ASCII art string."""
+        return Protocol.compress_frame(ascii_string.encode('utf-8'), codec, stream)
+    
+    @staticmethod
+    def decompress_ascii(compressed_bytes, codec=CODEC_ZLIB, stream=None):
+        """Decompress ASCII art string."""
+        return Protocol.decompress_frame(compressed_bytes, codec, stream).decode('utf-8')
+    
+    @staticmethod
+    def xor_frames(frame_bytes, reference, out=None):
+        """
+        XOR two encoded frames of equal length.
+        
+        Unchanged characters become zero bytes, which compress to almost
+        nothing. XORing the result with the reference again restores the frame.
+        
+        Args:
+            frame_bytes: Encoded frame
+            reference: Encoded frame of the same length
+            out: Optional uint8 array to write into; it is returned instead of bytes
         """
-        return zlib.decompress(compressed_bytes).decode('utf-8')
+        delta = np.bitwise_xor(np.frombuffer(frame_bytes, dtype=np.uint8),
+                               np.frombuffer(reference, dtype=np.uint8), out=out)
+        return delta if out is not None else delta.tobytes()
+    
+    @staticmethod
+    def create_video_keyframe(frame_bytes, codec=CODEC_ZLIB, stream=None):
+        """Create a full video frame message (list of buffers) from an encoded frame."""
+        compressed = Protocol.compress_frame_parts(frame_bytes, codec, stream)
+        return Protocol.encode_message_parts(MSG_VIDEO_FRAME, bytes((codec,)), *compressed)
+    
+    @staticmethod
+    def create_video_delta(frame_bytes, reference, codec=CODEC_ZLIB, stream=None):
+        """Create a video delta message (list of buffers) against the previously sent frame."""
+        # The delta is consumed by the compressor right away, so it can live in
+        # a per-thread scratch buffer instead of a new bytes object per frame
+        scratch = getattr(_delta_scratch, 'buffer', None)
+        if scratch is None or len(scratch) != len(frame_bytes):
+            scratch = _delta_scratch.buffer = np.empty(len(frame_bytes), dtype=np.uint8)
+        delta = Protocol.xor_frames(frame_bytes, reference, out=scratch)
+        compressed = Protocol.compress_frame_parts(delta, codec, stream)
+        return Protocol.encode_message_parts(MSG_VIDEO_DELTA, bytes((codec,)), *compressed)
+    
+    @staticmethod
+    def create_video_message(ascii_frame, codec=CODEC_ZLIB, stream=None):
+        """Create a video frame message tagged with its codec."""
+        return b''.join(Protocol.create_video_keyframe(ascii_frame.encode('utf-8'), codec, stream))
     
     @staticmethod
-    def create_video_message(ascii_frame):
-        """Create a video frame message."""
-        compressed = Protocol.compress_ascii(ascii_frame)
-        return Protocol.encode_message(MSG_VIDEO_FRAME, compressed)
+    def parse_video_keyframe(payload, stream=None):
+        """Parse a video frame message into the encoded frame."""
+        return Protocol.decompress_frame(memoryview(payload)[1:], payload[0], stream)
+    
+    @staticmethod
+    def parse_video_delta(payload, reference, stream=None):
+        """Parse a video delta message into the encoded frame."""
+        delta = Protocol.decompress_frame(memoryview(payload)[1:], payload[0], stream)
+        return Protocol.xor_frames(delta, reference)
+    
+    @staticmethod
+    def parse_video_message(payload, stream=None):
+        """Parse a video frame message into its ASCII frame."""
+        return Protocol.parse_video_keyframe(payload, stream).decode('utf-8')
+    
+    @staticmethod
+    def create_video_compressor():
+        """Create the sending side of a CODEC_ZLIB_STREAM connection."""
+        return zlib.compressobj(level=1)
+    
+    @staticmethod
+    def create_video_decompressor():
+        """Create the receiving side of a CODEC_ZLIB_STREAM connection."""
+        return zlib.decompressobj()
     
     @staticmethod
     def create_text_message(text):
@@ -103,26 +248,34 @@ class Protocol:
     @staticmethod
     def create_heartbeat():
         """Create a heartbeat message."""
-        return Protocol.encode_message(MSG_HEARTBEAT, b'')
+        return _HEARTBEAT
     
     @staticmethod
     def create_user_info(name, chat_color, theme_color):
         """Create a user info message with name and colors."""
-        import json
         data = {
             'name': name,
             'chat_color': chat_color,
-            'theme_color': theme_color
+            'theme_color': theme_color,
+            'codecs': list(SUPPORTED_CODECS)
         }
         return Protocol.encode_message(MSG_USER_INFO, json.dumps(data).encode('utf-8'))
     
     @staticmethod
     def parse_user_info(payload):
         """Parse user info from payload."""
-        import json
         data = json.loads(payload.decode('utf-8'))
         return data['name'], data['chat_color'], data['theme_color']
     
+    @staticmethod
+    def choose_video_codec(payload):
+        """Pick the preferred video codec both we and the peer support."""
+        peer_codecs = json.loads(payload.decode('utf-8')).get('codecs', [CODEC_ZLIB])
+        for codec in SUPPORTED_CODECS:
+            if codec in peer_codecs:
+                return codec
+        return CODEC_ZLIB
+    
     # Battleship game messages
     
     @staticmethod
@@ -133,16 +286,12 @@ class Protocol:
     @staticmethod
     def create_battleship_accept(accepted: bool):
         """Create battleship invitation response."""
-        import json
-        data = {'accepted': accepted}
-        return Protocol.encode_message(MSG_BATTLESHIP_ACCEPT, json.dumps(data).encode('utf-8'))
+        return Protocol.encode_message(MSG_BATTLESHIP_ACCEPT, _ACCEPT.pack(accepted))
     
     @staticmethod
     def parse_battleship_accept(payload):
         """Parse battleship acceptance response."""
-        import json
-        data = json.loads(payload.decode('utf-8'))
-        return data['accepted']
+        return _ACCEPT.unpack(payload)[0]
     
     @staticmethod
     def create_battleship_ship_placement(ships_data):
@@ -150,26 +299,41 @@ class Protocol:
         Create ship placement message.
         
         Args:
-            ships_data: List of dicts with ship info
+            ships_data: List of (row, col, size, is_horizontal) tuples
         """
-        import json
-        return Protocol.encode_message(MSG_BATTLESHIP_SHIP_PLACEMENT, json.dumps(ships_data).encode('utf-8'))
+        payload = b''.join(_PLACEMENT.pack(*ship) for ship in ships_data)
+        return Protocol.encode_message(MSG_BATTLESHIP_SHIP_PLACEMENT, payload)
     
     @staticmethod
     def parse_battleship_ship_placement(payload):
         """Parse ship placement data."""
-        import json
-        return json.loads(payload.decode('utf-8'))
+        return list(_PLACEMENT.iter_unpack(payload))
     
     @staticmethod
     def create_battleship_move(coordinate: str):
         """Create battleship move (attack) message."""
-        return Protocol.encode_message(MSG_BATTLESHIP_MOVE, coordinate.encode('utf-8'))
+        pos = BattleshipGame.coord_to_pos(coordinate)
+        if pos is None:
+            raise ValueError(f"Invalid coordinate: {coordinate!r}")
+        return Protocol.encode_message(MSG_BATTLESHIP_MOVE, _MOVE.pack(*pos))
+    
+    @staticmethod
+    def create_battleship_dice_roll(roll: int):
+        """Create battleship dice roll message (sent as a move during setup)."""
+        return Protocol.encode_message(MSG_BATTLESHIP_MOVE, _MOVE.pack(_DICE_ROLL_ROW, roll))
     
     @staticmethod
     def parse_battleship_move(payload):
-        """Parse battleship move."""
-        return payload.decode('utf-8')
+        """
+        Parse battleship move.
+        
+        Returns:
+            Coordinate string (e.g., "A5"), or the dice roll as a digit string
+        """
+        row, col = _MOVE.unpack(payload)
+        if row == _DICE_ROLL_ROW:
+            return str(col)
+        return BattleshipGame.pos_to_coord((row, col))
     
     @staticmethod
     def create_battleship_result(result: str, ship_name: str = None):
@@ -180,16 +344,14 @@ class Protocol:
             result: "hit", "miss", "sunk"
             ship_name: Name of ship if sunk
         """
-        import json
-        data = {'result': result, 'ship_name': ship_name}
-        return Protocol.encode_message(MSG_BATTLESHIP_RESULT, json.dumps(data).encode('utf-8'))
+        payload = _RESULT.pack(_RESULT_CODES.index(result), (ship_name or '').encode('utf-8'))
+        return Protocol.encode_message(MSG_BATTLESHIP_RESULT, payload)
     
     @staticmethod
     def parse_battleship_result(payload):
         """Parse battleship result."""
-        import json
-        data = json.loads(payload.decode('utf-8'))
-        return data['result'], data.get('ship_name')
+        code, ship_name = _RESULT.unpack(payload)
+        return _RESULT_CODES[code], ship_name.decode('utf-8') or None
     
     @staticmethod
     def create_battleship_quit():
@@ -216,9 +378,10 @@ if __name__ == "__main__":
     msg = Protocol.create_text_message(text)
     print(f"\nText message: {len(msg)} bytes")
     
-    msg_type, length = Protocol.decode_header(msg[:HEADER_SIZE])
+    msg_type, length, checksum = Protocol.decode_header(msg[:HEADER_SIZE])
     print(f"Type: 0x{msg_type:02x}, Length: {length}")
     payload = msg[HEADER_SIZE:]
+    assert Protocol.payload_checksum(payload) == checksum, "Checksum mismatch!"
     decoded_text = payload.decode('utf-8')
     print(f"Decoded: {decoded_text}")
     assert decoded_text == text, "Text mismatch!"
@@ -234,7 +397,20 @@ if __name__ == "__main__":
     assert decompressed == ascii_frame, "Decompression mismatch!"
     
     # Test video message
-    video_msg = Protocol.create_video_message(ascii_frame)
-    print(f"Video message total: {len(video_msg)} bytes")
+    for codec in SUPPORTED_CODECS:
+        compressor = Protocol.create_video_compressor()
+        decompressor = Protocol.create_video_decompressor()
+        for _ in range(2):
+            video_msg = Protocol.create_video_message(ascii_frame, codec, compressor)
+            print(f"Video message total (codec 0x{codec:02x}): {len(video_msg)} bytes")
+            decoded = Protocol.parse_video_message(video_msg[HEADER_SIZE:], decompressor)
+            assert decoded == ascii_frame, "Video mismatch!"
+    
+    # Test video delta
+    frame_bytes = ascii_frame.encode('utf-8')
+    next_bytes = ascii_frame.replace("@", "%", 3).encode('utf-8')
+    delta_msg = b''.join(Protocol.create_video_delta(next_bytes, frame_bytes))
+    print(f"Video delta total: {len(delta_msg)} bytes")
+    assert Protocol.parse_video_delta(delta_msg[HEADER_SIZE:], frame_bytes) == next_bytes, "Delta mismatch!"
     
     print("\n✅ All protocol tests passed!")
@@ -1,12 +1,13 @@
 import re
 
+# print(f"[DEBUG], print(f'[DEBUG] or print("[DEBUG] -> debug_log( with the same quote
+DEBUG_PRINT = re.compile(r'print\((f"|f\'|")\[DEBUG\]')
+
 with open('session.py', 'r', encoding='utf-8') as f:
     content = f.read()
 
-# Replace print(f"[DEBUG] with debug_log(f"
-content = re.sub(r'print\(f"\[DEBUG\]', r'debug_log(f"', content)
-content = re.sub(r'print\(f\'\[DEBUG\]', r'debug_log(f\'', content)
-content = re.sub(r'print\("\[DEBUG\]', r'debug_log("', content)
+# Replace print(f"[DEBUG] with debug_log(f" in a single pass
+content = DEBUG_PRINT.sub(r'debug_log(\1', content)
 
 with open('session.py', 'w', encoding='utf-8') as f:
     f.write(content)
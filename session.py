@@ -4,15 +4,13 @@ Session - Main coordinator that integrates all components
 import threading
 import time
 import re
-import subprocess
-import platform
-from video_capture import VideoCapture
+from video_capture import VideoCapture, take_prewarmed
 from ascii_converter import AsciiConverter
 from network import NetworkConnection, NetworkServer
 from terminal_ui import TerminalUI, InputHandler
 from sound_manager import SoundManager
 from battleship import BattleshipGame, BattleshipAI, Orientation, Ship
-from command_utils import open_manual, show_quick_help
+from command_utils import open_manual, show_quick_help, copy_to_clipboard
 from ai_assistant import BattleshipAI_Assistant
 
 # Debug logging to file
@@ -26,6 +24,41 @@ def debug_log(message):
     DEBUG_FILE.flush()
 
 
+# Emoji shortcodes replaced in outgoing chat messages
+EMOJI_MAP = {
+    ':)': '😊',
+    ':D': '😄',
+    ':(': '😢',
+    ':P': '😛',
+    ';)': '😉',
+    '<3': '❤️',
+    ':heart:': '❤️',
+    ':fire:': '🔥',
+    ':star:': '⭐',
+    ':check:': '✓',
+    ':x:': '✗',
+    ':thumbsup:': '👍',
+    ':thumbsdown:': '👎',
+    ':wave:': '👋',
+    ':clap:': '👏',
+    ':rocket:': '🚀',
+    ':eyes:': '👀',
+    ':100:': '💯',
+    ':thinking:': '🤔',
+    ':laugh:': '😂',
+    ':cry:': '😭',
+    ':cool:': '😎',
+    ':party:': '🎉',
+}
+
+# One pass over the text for all shortcodes; longer codes are tried first so
+# they win over any shorter code starting at the same position
+EMOJI_PATTERN = re.compile('|'.join(re.escape(code) for code in sorted(EMOJI_MAP, key=len, reverse=True)))
+
+# ANSI escape sequences (CSI color/cursor codes and two-byte escapes)
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
 class ChatSession:
     """Coordinates video chat session with all components."""
     
@@ -68,6 +101,10 @@ class ChatSession:
         # Create UI first to get terminal dimensions
         self.ui = TerminalUI(user_name=user_name, theme_color=theme_color)
         
+        # Shared blessed Terminal for formatting, and chat color formatters by name
+        self.term = self.ui.term
+        self._color_funcs = {}
+        
         # Auto-detect width from terminal if not specified
         if ascii_width is None:
             # Use the video_width from UI (which is half the terminal minus divider)
@@ -106,9 +143,29 @@ class ChatSession:
         self.battleship_my_dice_roll = None  # Our dice roll result
         self.battleship_opponent_dice_roll = None  # Opponent's dice roll
         
+        # Chat command handlers by name
+        self._commands = {
+            '/copyframe': self._cmd_copyframe,
+            '/color-mode': self._cmd_color_mode,
+            '/color-chat': self._cmd_color_chat,
+            '/theme': self._cmd_theme,
+            '/ping': self._cmd_ping,
+            '/togglesound': self._cmd_togglesound,
+            '/togglecam': self._cmd_togglecam,
+            '/exit': self._cmd_exit,
+            '/style': self._cmd_style,
+            '/manual': self._cmd_manual,
+            '/battleship': self._cmd_battleship,
+            '/quit': self._cmd_quit,
+            '/help': self._cmd_help,
+            '/map': self._cmd_map,
+            '/ai': self._cmd_ai,
+        }
+        
         # State
         self.running = False
         self.connected = False
+        self._stop_event = threading.Event()  # Set on shutdown to wake waiting loops
         
         # Threads
         self.capture_thread = None
@@ -147,8 +204,12 @@ class ChatSession:
             self.ui.set_status("Opening camera...")
             self.ui.add_message("System: Opening camera...")
             try:
-                self.video_capture = VideoCapture(device_id=self.device_id, fps_target=15)
-                self.video_capture.open()
+                # Use the camera main.py started opening during the countdown, if any
+                self.video_capture = take_prewarmed(self.device_id)
+                if self.video_capture is None:
+                    self.video_capture = VideoCapture(device_id=self.device_id, fps_target=15)
+                    self.video_capture.open()
+                self.video_capture.start_reader()
                 self.ui.add_message("System: Camera opened successfully!")
             except Exception as e:
                 self.ui.add_message(f"System: Camera error - {e}")
@@ -245,9 +306,7 @@ class ChatSession:
             self.theme_color
         )
         self.network.send(user_info_msg)
-        
-        # Wait briefly for their info (it will be handled in _receive_loop)
-        time.sleep(0.5)
+        # Their info is queued by the connection and handled in _receive_loop
     
     def _preview_loop(self):
         """Show camera preview while waiting for connection (host mode only)."""
@@ -257,8 +316,9 @@ class ChatSession:
         while self.running and not self.connected:
             try:
                 # Limit preview update rate to 2 FPS for host mode
-                if time.time() - last_update < 0.5:
-                    time.sleep(0.1)
+                wait = 0.5 - (time.time() - last_update)
+                if wait > 0:
+                    self._stop_event.wait(min(wait, 0.1))
                     continue
                 
                 last_update = time.time()
@@ -268,11 +328,10 @@ class ChatSession:
                     # Show placeholder when camera is off
                     ascii_frame = self.ascii_converter.generate_no_cam_placeholder()
                 else:
-                    # Capture frame
-                    frame = self.video_capture.read_frame_throttled()
+                    # Newest frame from the camera reader thread
+                    frame = self.video_capture.read_latest(timeout=0.1)
                     
                     if frame is None:
-                        time.sleep(0.05)
                         continue
                     
                     # Reset error count on successful capture
@@ -290,33 +349,34 @@ class ChatSession:
                     pass  # Silently skip errors during preview
                 if error_count >= 10:
                     break
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
     
     def _capture_loop(self):
         """Capture and send video frames."""
         error_count = 0
-        last_width_check = time.time()
+        last_frame = None
         
         while self.running and self.connected:
             try:
-                # Check if terminal was resized every 2 seconds
-                if time.time() - last_width_check > 2.0:
+                # Follow terminal resizes reported by the UI
+                if self.ui.resized.is_set():
+                    self.ui.resized.clear()
                     new_width = self.ui.video_width
                     if new_width != self.ascii_converter.width:
                         self.ascii_converter.set_width(new_width)
                         self.ui.add_message(f"System: Resized to {new_width} chars")
-                    last_width_check = time.time()
                 
                 # Check if camera is enabled
                 if not self.camera_enabled:
-                    # Show placeholder when camera is off
+                    # Show placeholder when camera is off (no need to check faster)
+                    self._stop_event.wait(0.1)
                     ascii_frame = self.ascii_converter.generate_no_cam_placeholder()
                 else:
-                    # Capture frame
-                    frame = self.video_capture.read_frame_throttled()
+                    # Newest frame from the camera reader thread; converting
+                    # this one overlaps with the camera producing the next
+                    frame = self.video_capture.read_latest(timeout=0.1)
                     
                     if frame is None:
-                        time.sleep(0.01)
                         continue
                     
                     # Reset error count on successful capture
@@ -325,12 +385,18 @@ class ChatSession:
                     # Convert to ASCII
                     ascii_frame = self.ascii_converter.image_to_ascii(frame)
                 
+                # A static scene (or the placeholder) gives the same frame again:
+                # nothing to redraw or send
+                if ascii_frame == last_frame:
+                    self.local_frame_count += 1
+                    continue
+                last_frame = ascii_frame
+                
                 # Update local preview
                 self.ui.update_local_frame(ascii_frame)
                 
-                # Send to peer
-                if self.network and self.network.is_connected():
-                    self.network.send_video_frame(ascii_frame)
+                # Send to peer (returns False once the connection is gone)
+                if self.network and self.network.send_video_frame(ascii_frame):
                     self.local_frame_count += 1
                 
             except Exception as e:
@@ -340,7 +406,7 @@ class ChatSession:
                 if error_count >= 5:
                     self.ui.add_message("System: Too many capture errors, stopping")
                     break
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
     
     def _receive_loop(self):
         """Receive and display remote video frames."""
@@ -349,30 +415,31 @@ class ChatSession:
         while self.running and self.connected:
             try:
                 # Check connection
-                if not self.network.is_connected():
+                if not self.network.connected:
                     self.ui.add_message("System: Connection lost")
                     self.connected = False
                     break
                 
-                # Get video frame
-                frame = self.network.get_video_frame(timeout=0.1)
-                if frame:
-                    self.ui.update_remote_frame(frame)
+                # Wait for the next message of any kind
+                item = self.network.get_next(timeout=1.0)
+                if item is None:
+                    continue
+                kind, payload = item
+                
+                if kind == 'video':
+                    self.ui.update_remote_frame(payload)
                     self.remote_frame_count += 1
                     error_count = 0
                 
-                # Get text messages
-                text = self.network.get_text_message(timeout=0.01)
-                if text:
+                elif kind == 'text':
+                    text = payload
                     # Check if this is a ping message
                     if text.startswith('[PING] '):
                         # Play loud alert sound for ping
                         self.sound_manager.play_ping_alert()
                         # Extract message and format with ATTENTION
                         ping_msg = text[7:]  # Remove '[PING] ' prefix
-                        from blessed import Terminal
-                        term = Terminal()
-                        color_func = getattr(term, self.remote_chat_color, term.white)
+                        color_func = self._color_func(self.remote_chat_color)
                         styled_ping = self._apply_styles(ping_msg)
                         self.ui.add_message(color_func(f"{self.remote_name}: ATTENTION: {styled_ping}"))
                     else:
@@ -380,33 +447,25 @@ class ChatSession:
                         self.sound_manager.play_chat_ding()
                         
                         # Format with remote user's color and apply styles
-                        from blessed import Terminal
-                        term = Terminal()
-                        color_func = getattr(term, self.remote_chat_color, term.white)
+                        color_func = self._color_func(self.remote_chat_color)
                         styled_text = self._apply_styles(text)
                         self.ui.add_message(color_func(f"{self.remote_name}: {styled_text}"))
                 
-                # Check for user info
-                user_info = self.network.get_user_info(timeout=0.01)
-                if user_info:
+                elif kind == 'user_info':
                     from protocol import Protocol
-                    name, chat_color, theme_color = Protocol.parse_user_info(user_info)
+                    name, chat_color, theme_color = Protocol.parse_user_info(payload)
                     self.remote_name = name
                     self.remote_chat_color = chat_color
                     self.remote_theme_color = theme_color
                     self.ui.update_remote_name(name, theme_color)
                     self.ui.add_message(f"System: {name} has joined the chat!")
                 
-                # Check for battleship messages
-                battleship_msg = self.network.get_battleship_message(timeout=0.01)
-                if battleship_msg:
-                    self._handle_battleship_message(battleship_msg)
+                elif kind == 'battleship':
+                    self._handle_battleship_message(payload)
                 
-                # Check for AI comments
-                ai_comment = self.network.get_ai_comment(timeout=0.01)
-                if ai_comment:
+                elif kind == 'ai':
                     from protocol import Protocol
-                    comment = Protocol.parse_ai_comment(ai_comment)
+                    comment = Protocol.parse_ai_comment(payload)
                     self.ui.add_message(f"🤖 AI: {comment}")
                 
             except Exception as e:
@@ -416,12 +475,11 @@ class ChatSession:
                 if error_count >= 5:
                     self.ui.add_message("System: Too many receive errors, stopping")
                     break
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
     
     def _stats_loop(self):
         """Update FPS statistics."""
-        while self.running:
-            time.sleep(1.0)
+        while not self._stop_event.wait(1.0):
             
             current_time = time.time()
             elapsed = current_time - self.last_stats_time
@@ -439,13 +497,19 @@ class ChatSession:
     
     def _main_loop(self):
         """Main loop - update input display."""
+        input_changed = self.input_handler.changed
+        last_text = None
+        
         while self.running and self.connected:
             try:
-                # Update input display
-                if self.input_handler:
-                    self.ui.set_input_text(self.input_handler.get_buffer())
-                
-                time.sleep(0.1)  # Slower to reduce CPU usage
+                # Redraw the input line only when a key changed its text
+                # (arrows and other ignored keys also wake us)
+                if input_changed.wait(0.1):
+                    input_changed.clear()
+                    text = self.input_handler.get_buffer()
+                    if text != last_text:
+                        self.ui.set_input_text(text)
+                        last_text = text
                 
             except KeyboardInterrupt:
                 break
@@ -518,44 +582,23 @@ class ChatSession:
             if self.network and self.network.is_connected():
                 self.network.send_text(message)
                 # Display with our chat color and apply styles
-                from blessed import Terminal
-                term = Terminal()
-                color_func = getattr(term, self.chat_color, term.white)
+                color_func = self._color_func(self.chat_color)
                 styled_message = self._apply_styles(message)
                 self.ui.add_message(color_func(f"You: {styled_message}"))
     
+    def _color_func(self, color):
+        """Return the (cached) Terminal formatter for a chat color, white if unknown."""
+        func = self._color_funcs.get(color)
+        if func is None:
+            func = self._color_funcs[color] = getattr(self.term, color, self.term.white)
+        return func
+    
     def _process_emojis(self, text):
         """Replace emoji codes with emojis."""
-        emoji_map = {
-            ':)': '😊',
-            ':D': '😄',
-            ':(': '😢',
-            ':P': '😛',
-            ';)': '😉',
-            '<3': '❤️',
-            ':heart:': '❤️',
-            ':fire:': '🔥',
-            ':star:': '⭐',
-            ':check:': '✓',
-            ':x:': '✗',
-            ':thumbsup:': '👍',
-            ':thumbsdown:': '👎',
-            ':wave:': '👋',
-            ':clap:': '👏',
-            ':rocket:': '🚀',
-            ':eyes:': '👀',
-            ':100:': '💯',
-            ':thinking:': '🤔',
-            ':laugh:': '😂',
-            ':cry:': '😭',
-            ':cool:': '😎',
-            ':party:': '🎉',
-        }
-        
-        for code, emoji in emoji_map.items():
-            text = text.replace(code, emoji)
-        
-        return text
+        # Every shortcode contains ':' or starts with ';' or '<'
+        if ':' not in text and ';' not in text and '<' not in text:
+            return text
+        return EMOJI_PATTERN.sub(lambda match: EMOJI_MAP[match.group(0)], text)
     
     def _apply_styles(self, text):
         """Apply text styling and colors based on markup syntax.
@@ -567,8 +610,7 @@ class ChatSession:
         
         Example: [bold red]Important[/bold red] [underline blue]link[/underline blue]
         """
-        from blessed import Terminal
-        term = Terminal()
+        term = self.term
         
         # Supported styles and colors
         styles = ['bold', 'italic', 'underline', 'strikeout']
@@ -658,36 +700,9 @@ class ChatSession:
         command = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
         
-        if command == '/copyframe':
-            self._cmd_copyframe(args)
-        elif command == '/color-mode':
-            self._cmd_color_mode(args)
-        elif command == '/color-chat':
-            self._cmd_color_chat(args)
-        elif command == '/theme':
-            self._cmd_theme(args)
-        elif command == '/ping':
-            self._cmd_ping(args)
-        elif command == '/togglesound':
-            self._cmd_togglesound(args)
-        elif command == '/togglecam':
-            self._cmd_togglecam(args)
-        elif command == '/exit':
-            self._cmd_exit(args)
-        elif command == '/style':
-            self._cmd_style(args)
-        elif command == '/manual':
-            self._cmd_manual(args)
-        elif command == '/battleship':
-            self._cmd_battleship(args)
-        elif command == '/quit':
-            self._cmd_quit(args)
-        elif command == '/help':
-            self._cmd_help(args)
-        elif command == '/map':
-            self._cmd_map(args)
-        elif command == '/ai':
-            self._cmd_ai(args)
+        handler = self._commands.get(command)
+        if handler:
+            handler(args)
         else:
             self.ui.add_message(f"System: Unknown command '{command}'. Type /help for available commands or /manual for full documentation")
     
@@ -714,21 +729,22 @@ class ChatSession:
         """Change color mode."""
         if not args or args.lower() == 'help':
             self.ui.add_message("System: /color-mode {colormode} - Change video color mode")
-            self.ui.add_message("System: Available modes: normal, rainbow, grayscale")
+            self.ui.add_message("System: Available modes: normal, palette256, rainbow, grayscale")
             self.ui.add_message("System: Solid colors: red, green, blue, yellow, magenta, cyan, white, black")
             return
         
         mode = args.lower().strip()
-        valid_modes = ['normal', 'rainbow', 'grayscale', 'bw', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan', 'white', 'black']
+        valid_modes = ['normal', 'palette256', 'rainbow', 'grayscale', 'bw', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan', 'white', 'black']
         
         if mode not in valid_modes:
             self.ui.add_message(f"System: Invalid color mode '{mode}'.")
-            self.ui.add_message("System: Valid modes: normal, rainbow, grayscale, red, green, blue, yellow, magenta, cyan, white, black")
+            self.ui.add_message("System: Valid modes: normal, palette256, rainbow, grayscale, red, green, blue, yellow, magenta, cyan, white, black")
             return
         
         # Map user-friendly names to internal names
         mode_mapping = {
             'normal': 'normal',
+            'palette256': 'palette256',
             'rainbow': 'rainbow',
             'grayscale': 'bw',
             'bw': 'bw',
@@ -806,9 +822,7 @@ class ChatSession:
         self.network.send_text(ping_text)
         
         # Display locally
-        from blessed import Terminal
-        term = Terminal()
-        color_func = getattr(term, self.chat_color, term.white)
+        color_func = self._color_func(self.chat_color)
         self.ui.add_message(color_func(f"You: ATTENTION: {ping_message}"))
     
     def _cmd_togglesound(self, args):
@@ -840,6 +854,7 @@ class ChatSession:
         self.ui.add_message("System: Exiting...")
         self.running = False
         self.connected = False
+        self._stop_event.set()
     
     def _cmd_style(self, args):
         """Show text styling help."""
@@ -854,66 +869,20 @@ class ChatSession:
     
     def _strip_ansi_codes(self, text):
         """Remove ANSI color codes from text."""
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        if '\x1b' not in text:
+            return text
+        return ANSI_ESCAPE.sub('', text)
     
     def _copy_to_clipboard(self, text):
         """Copy text to clipboard (cross-platform)."""
-        system = platform.system()
-        
-        if system == 'Windows':
-            try:
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
-                kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
-                kernel32.GetClipboardData.argtypes = [ctypes.c_uint]
-                kernel32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
-                
-                # Use PowerShell to copy to clipboard
-                process = subprocess.Popen(
-                    ['powershell', '-Command', f'$text = @"\n{text}\n"@ | Set-Clipboard'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                process.communicate()
-            except Exception:
-                # Fallback: try using clip command
-                process = subprocess.Popen(
-                    'clip',
-                    stdin=subprocess.PIPE,
-                    shell=True
-                )
-                process.communicate(input=text.encode('utf-8'))
-        
-        elif system == 'Darwin':  # macOS
-            process = subprocess.Popen(
-                ['pbcopy'],
-                stdin=subprocess.PIPE
-            )
-            process.communicate(input=text.encode('utf-8'))
-        
-        else:  # Linux
-            try:
-                process = subprocess.Popen(
-                    ['xclip', '-selection', 'clipboard'],
-                    stdin=subprocess.PIPE
-                )
-                process.communicate(input=text.encode('utf-8'))
-            except FileNotFoundError:
-                # Fallback to xsel if xclip is not available
-                process = subprocess.Popen(
-                    ['xsel', '--clipboard', '--input'],
-                    stdin=subprocess.PIPE
-                )
-                process.communicate(input=text.encode('utf-8'))
+        copy_to_clipboard(text)
     
     def _cmd_manual(self, args):
         """Open command manual in new terminal window."""
         if open_manual():
             self.ui.add_message("System: Opening manual in new window...")
         else:
-            self.ui.add_message("System: Failed to open manual. Check COMMANDS.md file exists.")
+            self.ui.add_message("System: Failed to open manual. Check COMMANDS.txt file exists.")
     
     def _cmd_help(self, args):
         """Show quick help in chat."""
@@ -981,13 +950,18 @@ class ChatSession:
         # Show user's message
         self.ui.add_message(f"You → AI: {args}")
         
-        # Get AI response in a separate thread to avoid blocking
-        def get_response():
-            response = self.ai_assistant.respond_to_chat(self.user_name, args)
-            if response:
-                self.ui.add_message(f"🤖 AI: {response}")
-        
-        threading.Thread(target=get_response, daemon=True).start()
+        # Stream the AI response into the chat in the background
+        def stream_response():
+            message = "🤖 AI: ..."
+            self.ui.add_message(message)
+            response = ""
+            for chunk in self.ai_assistant.stream_chat_response(self.user_name, args):
+                response += chunk
+                updated = f"🤖 AI: {response.strip()}"
+                self.ui.update_message(message, updated)
+                message = updated
+        
+        self.ai_assistant.submit(stream_response)
     
     def _send_ai_comment(self, comment):
         """Send AI comment to both local display and over network."""
@@ -1016,10 +990,9 @@ class ChatSession:
             # We don't know their positions, but we need to track which ones are sunk
             for ship_name, ship_size in BattleshipGame.SHIP_TYPES:
                 # Create dummy ships at position (0,0) - positions don't matter for multiplayer
-                # We only care about tracking which ships are sunk via hit_positions
+                # We only care about tracking which ships are sunk
                 dummy_ship = Ship(ship_name, ship_size, (0, 0), Orientation.HORIZONTAL)
-                # Don't set is_sunk directly - it's a computed property
-                # When we get a "sunk" result, we'll fill hit_positions
+                # When we get a "sunk" result, we'll call mark_opponent_ship_sunk()
                 self.battleship_game.opponent_ships.append(dummy_ship)
         
         # Activate game UI
@@ -1058,11 +1031,9 @@ class ChatSession:
         
         # AI opening trash talk (only commentator generates)
         if self.ai_enabled and self.ai_is_commentator:
-            def ai_intro():
-                opponent_name = self.remote_name if mode == "vs_human" else "AI"
-                comment = self.ai_assistant.comment_on_game_start(self.user_name, opponent_name if mode == "vs_human" else None)
-                self._send_ai_comment(comment)
-            threading.Thread(target=ai_intro, daemon=True).start()
+            opponent_name = self.remote_name if mode == "vs_human" else None
+            self.ai_assistant.submit(self.ai_assistant.comment_on_game_start, self.user_name, opponent_name,
+                                     callback=self._send_ai_comment)
     
     def _prompt_next_ship_placement(self):
         """Prompt user to place the next ship."""
@@ -1097,8 +1068,7 @@ class ChatSession:
             return
         
         # Use blessed Terminal for colors in chat
-        from blessed import Terminal
-        term = Terminal()
+        term = self.term
         
         self.ui.add_message("System: ┌─── Your Attack History ───┐")
         
@@ -1123,10 +1093,7 @@ class ChatSession:
                         is_hit = pos in self.battleship_my_hits
                     else:
                         # For AI mode, check actual ship positions
-                        for ship in self.battleship_game.opponent_ships:
-                            if pos in ship.positions:
-                                is_hit = True
-                                break
+                        is_hit = pos in self.battleship_game.opponent_cell_to_ship
                     
                     if is_hit:
                         # Red X for hits
@@ -1150,12 +1117,10 @@ class ChatSession:
     
     def _start_battleship_attack_phase(self):
         """Start the attack phase of the game."""
-        from blessed import Terminal
-        
         debug_log(f" _start_battleship_attack_phase called. Mode: {self.battleship_mode}")
         
         try:
-            term = Terminal()
+            term = self.term
             debug_log(" Terminal initialized")
             
             if self.battleship_mode == "vs_human":
@@ -1201,8 +1166,7 @@ class ChatSession:
     def _start_dice_roll(self):
         """Roll dice to determine who goes first."""
         import random
-        from blessed import Terminal
-        term = Terminal()
+        term = self.term
         
         debug_log(f" === _start_dice_roll called ===")
         debug_log(f" Game phase: {self.battleship_game.game_phase}")
@@ -1219,7 +1183,7 @@ class ChatSession:
         
         # Send our roll to opponent
         from protocol import Protocol
-        roll_msg = Protocol.create_battleship_move(str(self.battleship_my_dice_roll))  # Reusing move message
+        roll_msg = Protocol.create_battleship_dice_roll(self.battleship_my_dice_roll)
         self.network.send(roll_msg)
         debug_log(f" Sent dice roll ({self.battleship_my_dice_roll}) via MSG_BATTLESHIP_MOVE")
         
@@ -1232,8 +1196,7 @@ class ChatSession:
     
     def _determine_first_turn(self):
         """Determine who goes first based on dice rolls."""
-        from blessed import Terminal
-        term = Terminal()
+        term = self.term
         
         debug_log(f" === _determine_first_turn called ===")
         debug_log(f" My roll: {self.battleship_my_dice_roll}")
@@ -1359,18 +1322,14 @@ class ChatSession:
             self.ui.add_message(f"System: {coord_str} - HIT! ✕")
             # AI trash talk on hit (only if we're commentator)
             if self.ai_enabled and self.ai_is_commentator:
-                def ai_hit():
-                    comment = self.ai_assistant.comment_on_hit(self.user_name, coord_str, True)
-                    self._send_ai_comment(comment)
-                threading.Thread(target=ai_hit, daemon=True).start()
+                self.ai_assistant.submit(self.ai_assistant.comment_on_hit, self.user_name, coord_str, True,
+                                         callback=self._send_ai_comment)
         elif result == "sunk":
             self.ui.add_message(f"System: {coord_str} - HIT! You sunk their {ship_name}! ✗")
             # AI trash talk on sunk (only if we're commentator)
             if self.ai_enabled and self.ai_is_commentator:
-                def ai_sunk():
-                    comment = self.ai_assistant.comment_on_sunk(self.user_name, ship_name, True)
-                    self._send_ai_comment(comment)
-                threading.Thread(target=ai_sunk, daemon=True).start()
+                self.ai_assistant.submit(self.ai_assistant.comment_on_sunk, self.user_name, ship_name, True,
+                                         callback=self._send_ai_comment)
         
         # Show attack history chart
         self._show_attack_history()
@@ -1378,8 +1337,7 @@ class ChatSession:
         # Check for winner
         winner = self.battleship_game.check_winner()
         if winner:
-            from blessed import Terminal
-            term = Terminal()
+            term = self.term
             if winner == "player":
                 self.ui.add_message(term.bright_green("System: ★★★ VICTORY! You sunk all enemy ships! ★★★"))                
             else:
@@ -1390,14 +1348,13 @@ class ChatSession:
             
             # AI final commentary (only if we're commentator)
             if self.ai_enabled and self.ai_is_commentator:
-                def ai_endgame():
-                    opponent = self.remote_name if self.battleship_mode == "vs_human" else "AI"
-                    comment = self.ai_assistant.comment_on_victory(
-                        self.user_name if winner == "player" else opponent,
-                        opponent if winner == "player" else self.user_name
-                    )
-                    self._send_ai_comment(comment)
-                threading.Thread(target=ai_endgame, daemon=True).start()
+                opponent = self.remote_name if self.battleship_mode == "vs_human" else "AI"
+                self.ai_assistant.submit(
+                    self.ai_assistant.comment_on_victory,
+                    self.user_name if winner == "player" else opponent,
+                    opponent if winner == "player" else self.user_name,
+                    callback=self._send_ai_comment
+                )
             
             self._update_battleship_display()
             return
@@ -1429,8 +1386,7 @@ class ChatSession:
             # Check for winner again
             winner = self.battleship_game.check_winner()
             if winner:
-                from blessed import Terminal
-                term = Terminal()
+                term = self.term
                 if winner == "player":
                     self.ui.add_message(term.bright_green("System: ★★★ VICTORY! You sunk all enemy ships! ★★★"))
                 else:
@@ -1531,8 +1487,7 @@ class ChatSession:
         elif msg_type == MSG_BATTLESHIP_SHIP_PLACEMENT:
             # Opponent finished ship placement
             if self.battleship_game and self.battleship_mode == "vs_human":
-                from blessed import Terminal
-                term = Terminal()
+                term = self.term
                 self.battleship_opponent_ships_placed = True
                 self.ui.add_message(term.blue(f"System: {self.remote_name} has finished placing ships!"))
                 debug_log(f" Received MSG_BATTLESHIP_SHIP_PLACEMENT from opponent")
@@ -1598,8 +1553,7 @@ class ChatSession:
                     # Check for winner
                     winner = self.battleship_game.check_winner()
                     if winner:
-                        from blessed import Terminal
-                        term = Terminal()
+                        term = self.term
                         if winner == "opponent":
                             # Opponent sunk all our ships - they win, we lose
                             self.ui.add_message("System: ☠ DEFEAT! All your ships were sunk! ☠")
@@ -1630,13 +1584,7 @@ class ChatSession:
                     
                     # If a ship was sunk, mark it in our opponent_ships list
                     if result == "sunk" and ship_name:
-                        for ship in self.battleship_game.opponent_ships:
-                            if ship.name == ship_name:
-                                # Mark ship as sunk by filling all its hit_positions
-                                # is_sunk is a computed property based on hit_positions
-                                for pos in ship.positions:
-                                    ship.hit_positions.add(pos)
-                                break
+                        self.battleship_game.mark_opponent_ship_sunk(ship_name)
                 
                 # Display the result of our attack
                 
@@ -1665,8 +1613,7 @@ class ChatSession:
                 # Check if we won (all opponent ships sunk)
                 winner = self.battleship_game.check_winner()
                 if winner:
-                    from blessed import Terminal
-                    term = Terminal()
+                    term = self.term
                     if winner == "player":
                         self.ui.add_message(term.bright_green("System: ★★★ VICTORY! You sunk all enemy ships! ★★★"))
                         self.sound_manager.play_battleship_win()
@@ -1690,6 +1637,7 @@ class ChatSession:
         """Stop the session and clean up."""
         self.running = False
         self.connected = False
+        self._stop_event.set()
         
         # Stop UI components
         if self.input_handler:
@@ -1711,6 +1659,9 @@ class ChatSession:
         if self.video_capture:
             self.video_capture.close()
         
+        # Stop AI assistant background workers
+        self.ai_assistant.close()
+        
         print("\nSession ended.")
 
 
@@ -2,6 +2,7 @@
 Terminal UI - Blessed-based terminal interface for video chat
 """
 from blessed import Terminal
+import signal
 import threading
 import time
 
@@ -40,14 +41,37 @@ class TerminalUI:
         self.battleship_attack_board = ""
         self.battleship_status = ""
         
+        # Set whenever a resize changes the video width
+        self.resized = threading.Event()
+        
+        # Re-query the terminal size only after SIGWINCH (every frame where unavailable)
+        self._size_dirty = False
+        self._resize_signal = self._install_resize_handler()
+        
         # Layout
         self.update_layout()
         
         # Lock for thread-safe updates
         self.lock = threading.Lock()
     
+    def _install_resize_handler(self):
+        """Listen for SIGWINCH; returns False if it cannot be used here."""
+        if not hasattr(signal, 'SIGWINCH'):  # Windows
+            return False
+        try:
+            signal.signal(signal.SIGWINCH, self._on_resize)
+        except ValueError:
+            # Handlers can only be installed from the main thread
+            return False
+        return True
+    
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler - mark the terminal size as stale."""
+        self._size_dirty = True
+    
     def update_layout(self):
         """Calculate layout dimensions based on terminal size."""
+        old_video_width = getattr(self, 'video_width', None)
         self.width = self.term.width
         self.height = self.term.height
         
@@ -73,6 +97,9 @@ class TerminalUI:
         self.chat_y = self.video_height + 1
         self.status_y = self.height - 2
         self.input_y = self.height - 1
+        
+        if self.video_width != old_video_width:
+            self.resized.set()
     
     def start(self):
         """Start the UI rendering loop."""
@@ -102,7 +129,12 @@ class TerminalUI:
         """Render a single frame of the UI."""
         with self.lock:
             # Check for resize
-            if self.term.width != self.width or self.term.height != self.height:
+            if self._size_dirty or not self._resize_signal:
+                self._size_dirty = False
+                resized = self.term.width != self.width or self.term.height != self.height
+            else:
+                resized = False
+            if resized:
                 self.update_layout()
                 # Signal that layout changed
                 self.layout_changed = True
@@ -258,6 +290,15 @@ class TerminalUI:
             if len(self.messages) > 100:
                 self.messages = self.messages[-100:]
     
+    def update_message(self, old_message, new_message):
+        """Replace the most recent copy of a chat message (e.g. while it streams in)."""
+        with self.lock:
+            for i in range(len(self.messages) - 1, -1, -1):
+                if self.messages[i] == old_message:
+                    self.messages[i] = new_message
+                    return
+            self.messages.append(new_message)
+    
     def set_status(self, status):
         """Update status text."""
         with self.lock:
@@ -329,6 +370,7 @@ class InputHandler:
         self.running = False
         self.input_thread = None
         self.input_buffer = ""
+        self.changed = threading.Event()  # Set whenever a key was handled
         
         # History tracking
         self.history = []
@@ -389,6 +431,8 @@ class InputHandler:
                             if len(self.input_buffer) < 200:  # Limit input length
                                 self.input_buffer += key
                         
+                        self.changed.set()
+                        
             except Exception as e:
                 # Don't crash on input errors
                 pass
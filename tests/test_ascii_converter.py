@@ -0,0 +1,102 @@
+"""
+Test ASCII converter color mapping
+"""
+import numpy as np
+import ascii_converter
+from ascii_converter import AsciiConverter
+
+
+def test_rainbow_colors_match_scalar():
+    """Vectorized rainbow colors should match the per-pixel version."""
+    converter = AsciiConverter(width=16, color_mode="rainbow")
+    gray = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    
+    colors = converter._get_rainbow_colors(gray)
+    
+    assert colors.shape == (16, 16, 3)
+    for brightness in range(256):
+        y, x = divmod(brightness, 16)
+        assert tuple(colors[y, x]) == converter._get_rainbow_color(brightness)
+
+
+def test_brightness_lut_matches_scalar():
+    """Each lookup table entry should be the escape code for that brightness."""
+    converter = AsciiConverter(width=16, color_mode="rainbow")
+    codes, color_ids = converter._get_brightness_lut("rainbow")
+    
+    for brightness in (0, 63, 64, 127, 128, 191, 192, 255):
+        r, g, b = converter._get_rainbow_color(brightness)
+        assert codes[brightness] == f'\033[38;2;{r:03d};{g:03d};{b:03d}m'
+    
+    assert color_ids[0] != color_ids[255]
+    
+    # Brightness levels with the same color share an id
+    _, color_ids = converter._get_brightness_lut("black")
+    assert color_ids[0] == color_ids[1]
+
+
+def test_color_runs_emit_one_code():
+    """A line of one color should only contain a single escape code."""
+    frame = np.full((40, 80, 3), 200, dtype=np.uint8)
+    for mode in ("rainbow", "normal", "palette256", "red"):
+        converter = AsciiConverter(width=40, color_mode=mode)
+        line = converter.image_to_ascii(frame).split('\n')[0]
+        assert line.count('\033[38;') == 1, mode
+        assert line.endswith('\033[0m')
+
+
+def test_palette256_indices():
+    """RGB colors should map to the nearest corner of the 6x6x6 color cube."""
+    converter = AsciiConverter(width=16, color_mode="palette256")
+    colors = np.array([[[0, 0, 0], [255, 255, 255], [255, 0, 0], [0, 0, 255]]], dtype=np.uint8)
+    
+    assert converter._get_palette256_indices(colors).tolist() == [[16, 231, 196, 21]]
+
+
+def test_bw_output_shape():
+    """Black and white output should have one character per cell and no escape codes."""
+    converter = AsciiConverter(width=40, color_mode="bw")
+    frame = np.zeros((60, 80, 3), dtype=np.uint8)
+    frame[:, 40:] = 255
+    
+    lines = converter.image_to_ascii(frame).split('\n')
+    
+    assert len(lines) == 15
+    assert all(len(line) == 40 for line in lines)
+    assert '\033' not in lines[0]
+    assert lines[0][0] == converter.chars[0]
+    assert lines[0][-1] == converter.chars[-1]
+
+
+def test_numba_matches_numpy():
+    """The compiled renderer should produce exactly the NumPy lookup output."""
+    if not ascii_converter.NUMBA_AVAILABLE:
+        print("Numba not installed, skipping")
+        return
+    
+    # Kernels compile in the background; frames use NumPy until they're ready
+    ascii_converter.prewarm_kernels()
+    assert ascii_converter._kernels_ready.wait(120)
+    
+    frame = np.random.default_rng(0).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+    for mode in ("bw", "rainbow", "red", "black", "white", "normal", "palette256"):
+        converter = AsciiConverter(width=60, color_mode=mode)
+        compiled = converter.image_to_ascii(frame)
+        
+        ascii_converter.NUMBA_AVAILABLE = False
+        try:
+            expected = converter.image_to_ascii(frame)
+        finally:
+            ascii_converter.NUMBA_AVAILABLE = True
+        
+        assert compiled == expected, mode
+
+
+if __name__ == "__main__":
+    test_rainbow_colors_match_scalar()
+    test_brightness_lut_matches_scalar()
+    test_color_runs_emit_one_code()
+    test_palette256_indices()
+    test_bw_output_shape()
+    test_numba_matches_numpy()
+    print("✓ ASCII converter tests passed")
@@ -0,0 +1,171 @@
+"""
+Test battleship placement and attack rules
+"""
+import random
+from battleship import (BattleshipGame, BattleshipAI, Orientation, Ship, cell_bit,
+                        CELL_CODE_STATES, CELL_FMT_COLOR, CELL_FMT_PLAIN)
+
+
+def test_coordinate_round_trip():
+    """Every cell should round-trip through its coordinate string."""
+    for row in range(10):
+        for col in range(10):
+            coord = BattleshipGame.pos_to_coord((row, col))
+            assert BattleshipGame.coord_to_pos(coord) == (row, col)
+            assert BattleshipGame.coord_to_pos(f" {coord.lower()} ") == (row, col)
+    
+    for coord in ("", "A", "A0", "A11", "K1", "5A", "invalid"):
+        assert BattleshipGame.coord_to_pos(coord) is None
+
+
+def test_ship_positions():
+    """Ships should report the cells they cover in order."""
+    ship = Ship("Cruiser", 3, (2, 4), Orientation.HORIZONTAL)
+    assert list(ship.positions) == [(2, 4), (2, 5), (2, 6)]
+    
+    ship = Ship("Destroyer", 2, (7, 1), Orientation.VERTICAL)
+    assert list(ship.positions) == [(7, 1), (8, 1)]
+
+
+def test_ship_sinks_once_every_cell_is_hit():
+    """Repeated hits on one cell should not sink a ship early."""
+    ship = Ship("Destroyer", 2, (0, 0), Orientation.HORIZONTAL)
+    assert ship.hit((0, 0))
+    assert ship.hit((0, 0))
+    assert not ship.hit((1, 0))
+    assert not ship.is_sunk
+    assert ship.hit((0, 1))
+    assert ship.is_sunk
+    
+    ship = Ship("Cruiser", 3, (0, 0), Orientation.VERTICAL)
+    ship.mark_sunk()
+    assert ship.is_sunk
+
+
+def test_overlapping_placement_rejected():
+    """Ships may not overlap or run off the board."""
+    game = BattleshipGame(mode="vs_ai")
+    assert game.place_ship("Carrier", 5, (0, 0), Orientation.HORIZONTAL)
+    assert not game.place_ship("Battleship", 4, (0, 4), Orientation.VERTICAL)
+    assert not game.place_ship("Battleship", 4, (0, 7), Orientation.HORIZONTAL)
+    assert game.place_ship("Battleship", 4, (1, 4), Orientation.VERTICAL)
+    assert len(game.player_ships) == 2
+
+
+def test_attack_until_sunk():
+    """Attacks should report hit, sunk, miss and repeats."""
+    game = BattleshipGame(mode="vs_ai")
+    game.place_ship("Destroyer", 2, (3, 3), Orientation.VERTICAL, is_player=False)
+    
+    assert game.attack((3, 3)) == ("hit", None)
+    assert game.attack((3, 3)) == ("already_attacked", None)
+    assert game.attack((0, 0)) == ("miss", None)
+    assert game.attack((4, 3)) == ("sunk", "Destroyer")
+    assert game.attack((10, 0)) == ("invalid", None)
+    assert game.get_remaining_ships(is_player=False) == 0
+
+
+def test_winner_after_last_ship_sinks():
+    """check_winner should report a winner only once a whole fleet is sunk."""
+    game = BattleshipGame(mode="vs_ai")
+    game.place_ship("Destroyer", 2, (0, 0), Orientation.HORIZONTAL, is_player=True)
+    game.place_ship("Destroyer", 2, (5, 5), Orientation.VERTICAL, is_player=False)
+    game.place_ship("Cruiser", 3, (9, 0), Orientation.HORIZONTAL, is_player=False)
+    assert game.check_winner() is None
+    
+    game.attack((5, 5))
+    game.attack((6, 5))
+    assert game.check_winner() is None
+    game.mark_opponent_ship_sunk("Cruiser")
+    assert game.get_remaining_ships(is_player=False) == 0
+    assert game.check_winner() == "player"
+
+
+def test_bitboards_track_ships_and_hits():
+    """Ship and hit bitboards should mirror the placed ships and hits."""
+    game = BattleshipGame(mode="vs_ai")
+    game.place_ship("Destroyer", 2, (0, 8), Orientation.HORIZONTAL, is_player=False)
+    game.place_ship("Submarine", 3, (7, 0), Orientation.VERTICAL, is_player=False)
+    
+    expected = 0
+    for ship in game.opponent_ships:
+        for pos in ship.positions:
+            expected |= cell_bit(pos)
+    assert game.opponent_ships_mask == expected
+    
+    game.attack((0, 9))
+    game.attack((5, 5))
+    assert game.opponent_hits_mask == cell_bit((0, 9))
+    assert game.player_hits_mask == 0
+
+
+def test_ai_places_every_ship():
+    """AI placement should always fit the whole fleet without overlaps."""
+    for seed in range(50):
+        random.seed(seed)
+        game = BattleshipGame(mode="vs_ai")
+        BattleshipAI(game).place_ships()
+        assert len(game.opponent_ships) == len(BattleshipGame.SHIP_TYPES)
+        assert bin(game.opponent_ships_mask).count("1") == sum(size for _, size in BattleshipGame.SHIP_TYPES)
+
+
+def test_probability_grid_counts_open_placements():
+    """Each cell's count should equal the open placements covering it."""
+    random.seed(3)
+    game = BattleshipGame(mode="vs_ai")
+    ai = BattleshipAI(game)
+    for _ in range(30):
+        ai.process_result((random.randrange(10), random.randrange(10)), "miss", None)
+    ai.remaining_ship_sizes.pop("Carrier")
+    
+    expected = [[0] * 10 for _ in range(10)]
+    for length in ai.remaining_ship_sizes.values():
+        for is_horizontal in (True, False):
+            for row in range(10):
+                for col in range(10):
+                    if is_horizontal:
+                        cells = [(row, col + i) for i in range(length)]
+                    else:
+                        cells = [(row + i, col) for i in range(length)]
+                    if all(r < 10 and c < 10 and not ai.attack_grid[r, c] for r, c in cells):
+                        for r, c in cells:
+                            expected[r][c] += 1
+    
+    assert ai.get_probability_grid().tolist() == expected
+
+
+def test_state_grid_matches_cell_state():
+    """The vectorized state grid should agree with get_cell_state."""
+    random.seed(7)
+    game = BattleshipGame(mode="vs_ai")
+    BattleshipAI(game).place_ships()
+    for _ in range(60):
+        game.attack((random.randrange(10), random.randrange(10)))
+    
+    for show_ships in (True, False):
+        codes = game.get_state_grid(is_player_grid=False, show_ships=show_ships)
+        for row in range(10):
+            for col in range(10):
+                expected = game.get_cell_state((row, col), False, show_ships)
+                assert CELL_CODE_STATES[codes[row, col]] == expected
+    
+    for use_color, cell_fmt in ((True, CELL_FMT_COLOR), (False, CELL_FMT_PLAIN)):
+        lines = game.get_board_display(False, show_ships=True, use_color=use_color).split("\n")
+        assert lines[0] == "     1  2  3  4  5  6  7  8  9 10"
+        for row in range(10):
+            cells = "".join(cell_fmt[game.get_cell_state((row, col), False)] for col in range(10))
+            assert lines[row + 1] == f" {chr(ord('A') + row)}  " + cells
+
+
+if __name__ == "__main__":
+    test_coordinate_round_trip()
+    test_ship_positions()
+    test_ship_sinks_once_every_cell_is_hit()
+    test_overlapping_placement_rejected()
+    test_attack_until_sunk()
+    test_winner_after_last_ship_sinks()
+    test_bitboards_track_ships_and_hits()
+    test_ai_places_every_ship()
+    test_probability_grid_counts_open_placements()
+    test_state_grid_matches_cell_state()
+    print("✓ All battleship rule tests passed!")
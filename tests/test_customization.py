@@ -16,22 +16,12 @@ def test_emoji_conversion():
         ("Hello :wave: how are you :)", "Hello 👋 how are you 😊"),
         ("Great work! :thumbsup: :100:", "Great work! 👍 💯"),
         ("<3 this project :rocket:", "❤️ this project 🚀"),
+        ("no shortcodes here", "no shortcodes here"),
     ]
     
-    # Create a minimal session instance
+    # Create a minimal session instance using the real emoji processing
     class MockSession:
-        def _process_emojis(self, text):
-            emoji_map = {
-                ':)': '😊', ':D': '😄', ':(': '😢', ':P': '😛', ';)': '😉',
-                '<3': '❤️', ':heart:': '❤️', ':fire:': '🔥', ':star:': '⭐',
-                ':check:': '✓', ':x:': '✗', ':thumbsup:': '👍', ':thumbsdown:': '👎',
-                ':wave:': '👋', ':clap:': '👏', ':rocket:': '🚀', ':eyes:': '👀',
-                ':100:': '💯', ':thinking:': '🤔', ':laugh:': '😂', ':cry:': '😭',
-                ':cool:': '😎', ':party:': '🎉',
-            }
-            for code, emoji in emoji_map.items():
-                text = text.replace(code, emoji)
-            return text
+        _process_emojis = ChatSession._process_emojis
     
     session = MockSession()
     
@@ -0,0 +1,359 @@
+"""
+Test message framing over a local socket pair
+"""
+import json
+import socket
+import time
+from network import NetworkConnection
+from protocol import (Protocol, HEADER_SIZE, MSG_TEXT_MESSAGE, MSG_BATTLESHIP_INVITE, MSG_BATTLESHIP_MOVE,
+                      CODEC_ZLIB, CODEC_ZLIB_STREAM, SUPPORTED_CODECS)
+
+
+def _connected_pair():
+    """Return a running NetworkConnection and the raw peer socket."""
+    local, peer = socket.socketpair()
+    conn = NetworkConnection(sock=local)
+    conn.start_as_accepted()
+    return conn, peer
+
+
+def test_messages_split_across_segments():
+    """Messages arriving a few bytes at a time should be reassembled."""
+    conn, peer = _connected_pair()
+    try:
+        frame = "@@##**++::  \n" * 40
+        data = (Protocol.create_text_message("hello") +
+                Protocol.create_video_message(frame) +
+                Protocol.create_text_message("world"))
+        for i in range(0, len(data), 7):
+            peer.sendall(data[i:i + 7])
+
+        assert conn.get_text_message(timeout=2) == "hello"
+        assert conn.get_video_frame(timeout=2) == frame
+        assert conn.get_text_message(timeout=2) == "world"
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_message_larger_than_receive_buffer():
+    """A payload bigger than the initial buffer should grow it."""
+    conn, peer = _connected_pair()
+    try:
+        text = "x" * 300000
+        peer.sendall(Protocol.create_text_message("first"))
+        peer.sendall(Protocol.create_text_message(text))
+        peer.sendall(Protocol.create_text_message("after"))
+
+        assert conn.get_text_message(timeout=2) == "first"
+        assert conn.get_text_message(timeout=2) == text
+        assert conn.get_text_message(timeout=2) == "after"
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_corrupted_message_dropped():
+    """A message whose payload fails its checksum should be skipped."""
+    conn, peer = _connected_pair()
+    try:
+        corrupted = bytearray(Protocol.create_text_message("hello"))
+        corrupted[-1] ^= 0x01
+        peer.sendall(bytes(corrupted))
+        peer.sendall(Protocol.create_text_message("world"))
+        
+        assert conn.get_text_message(timeout=2) == "world"
+        assert conn.get_text_message(timeout=0.1) is None
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_heartbeats_and_timeouts():
+    """Heartbeats should flow both ways; a silent peer should time out."""
+    a, b = socket.socketpair()
+    first = NetworkConnection(sock=a)
+    second = NetworkConnection(sock=b)
+    for conn in (first, second):
+        conn.heartbeat_interval = 0.05
+        conn.heartbeat_timeout = 0.5
+        conn.start_as_accepted()
+    
+    local, peer = socket.socketpair()
+    lonely = NetworkConnection(sock=local)
+    lonely.heartbeat_interval = 0.05
+    lonely.heartbeat_timeout = 0.2
+    lonely.start_as_accepted()
+    try:
+        started = time.time()
+        time.sleep(1.0)
+        assert first.is_connected() and second.is_connected()
+        assert first.last_heartbeat > started and second.last_heartbeat > started
+        assert not lonely.is_connected()
+    finally:
+        first.close()
+        second.close()
+        lonely.close()
+        peer.close()
+
+
+def test_peer_close_detected():
+    """Closing the other end should mark the connection as lost."""
+    conn, peer = _connected_pair()
+    try:
+        peer.close()
+        deadline = time.time() + 2
+        while conn.is_connected() and time.time() < deadline:
+            time.sleep(0.01)
+        assert not conn.is_connected()
+    finally:
+        conn.close()
+
+
+def test_messages_routed_to_their_queues():
+    """Each message type should land in its own queue."""
+    conn, peer = _connected_pair()
+    try:
+        peer.sendall(Protocol.create_battleship_invite())
+        peer.sendall(Protocol.create_battleship_move("B2"))
+        peer.sendall(Protocol.create_ai_comment("nice shot"))
+        peer.sendall(Protocol.encode_message(0x7F, b"unknown type is ignored"))
+        peer.sendall(Protocol.create_text_message("hi"))
+        
+        assert conn.get_battleship_message(timeout=2) == (MSG_BATTLESHIP_INVITE, b"")
+        msg_type, payload = conn.get_battleship_message(timeout=2)
+        assert msg_type == MSG_BATTLESHIP_MOVE and Protocol.parse_battleship_move(payload) == "B2"
+        assert Protocol.parse_ai_comment(conn.get_ai_comment(timeout=2)) == "nice shot"
+        assert conn.get_text_message(timeout=2) == "hi"
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_get_next_waits_on_all_queues():
+    """get_next should return each kind of message, control messages first."""
+    conn, peer = _connected_pair()
+    try:
+        assert conn.get_next(timeout=0.05) is None
+        peer.sendall(Protocol.create_video_message("frame\n"))
+        peer.sendall(Protocol.create_text_message("hi"))
+        peer.sendall(Protocol.create_ai_comment("nice shot"))
+        peer.sendall(Protocol.create_battleship_invite())
+        
+        # Messages are handled in order, so all are queued once the last one is
+        deadline = time.time() + 2
+        while conn.battleship_queue.empty() and time.time() < deadline:
+            time.sleep(0.01)
+        
+        assert conn.get_next(timeout=0) == ('text', "hi")
+        assert conn.get_next(timeout=0) == ('battleship', (MSG_BATTLESHIP_INVITE, b""))
+        kind, payload = conn.get_next(timeout=0)
+        assert kind == 'ai' and Protocol.parse_ai_comment(payload) == "nice shot"
+        assert conn.get_next(timeout=0) == ('video', "frame\n")
+        
+        peer.close()
+        started = time.time()
+        assert conn.get_next(timeout=2) is None
+        assert time.time() - started < 1
+    finally:
+        conn.close()
+
+
+def test_video_queue_keeps_most_recent_frames():
+    """Only the newest frames should be kept when the reader falls behind."""
+    conn, peer = _connected_pair()
+    try:
+        assert conn.get_video_frame(timeout=0.05) is None
+        frames = [f"frame {i}\n" for i in range(8)]
+        for frame in frames:
+            peer.sendall(Protocol.create_video_message(frame))
+        peer.sendall(Protocol.create_text_message("done"))
+        assert conn.get_text_message(timeout=2) == "done"
+        
+        received = []
+        frame = conn.get_video_frame(timeout=0.05)
+        while frame is not None:
+            received.append(frame)
+            frame = conn.get_video_frame(timeout=0.05)
+        assert received == frames[-5:]
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_queued_video_frames_coalesce():
+    """Frames queued faster than they are sent should collapse to the newest."""
+    a, b = socket.socketpair()
+    sender = NetworkConnection(sock=a)
+    receiver = NetworkConnection(sock=b)
+    receiver.start_as_accepted()
+    try:
+        # Queue before the send thread exists, as if the socket were blocked
+        sender.connected = True
+        for i in range(3):
+            assert sender.send_video_frame(f"frame {i}\n")
+        sender.start_as_accepted()
+        
+        assert receiver.get_video_frame(timeout=2) == "frame 2\n"
+        assert receiver.get_video_frame(timeout=0.2) is None
+    finally:
+        sender.close()
+        receiver.close()
+
+
+def test_send_parts_delivers_one_message():
+    """A message sent as separate buffers should arrive as one message."""
+    a, b = socket.socketpair()
+    sender = NetworkConnection(sock=a)
+    receiver = NetworkConnection(sock=b)
+    sender.start_as_accepted()
+    receiver.start_as_accepted()
+    try:
+        text = "y" * 200000
+        parts = Protocol.encode_message_parts(MSG_TEXT_MESSAGE, b"", text[:7].encode(), text[7:].encode())
+        assert sender.send_parts(parts)
+        assert receiver.get_text_message(timeout=2) == text
+    finally:
+        sender.close()
+        receiver.close()
+
+
+def test_video_codec_negotiation():
+    """Peers should agree on a codec from each other's user info."""
+    old_peer = json.dumps({'name': 'a', 'chat_color': 'white', 'theme_color': 'green'}).encode('utf-8')
+    assert Protocol.choose_video_codec(old_peer) == CODEC_ZLIB
+    
+    conn, peer = _connected_pair()
+    try:
+        assert conn.video_codec == CODEC_ZLIB
+        peer.sendall(Protocol.create_user_info("peer", "white", "green"))
+        assert conn.get_user_info(timeout=2) is not None
+        assert conn.video_codec == SUPPORTED_CODECS[0]
+        
+        frame = "@@##**++::  \n" * 40
+        for codec in SUPPORTED_CODECS:
+            msg = Protocol.create_video_message(frame, codec, Protocol.create_video_compressor())
+            payload = msg[HEADER_SIZE:]
+            assert Protocol.parse_video_message(payload, Protocol.create_video_decompressor()) == frame
+    finally:
+        conn.close()
+        peer.close()
+
+
+def _stream_video_messages(frames, keyframes):
+    """Encode frames the way a sender on CODEC_ZLIB_STREAM would."""
+    messages = []
+    compressor = None
+    previous = b''
+    for i, frame in enumerate(frames):
+        frame_bytes = frame.encode('utf-8')
+        if i in keyframes:
+            compressor = Protocol.create_video_compressor()
+            parts = Protocol.create_video_keyframe(frame_bytes, CODEC_ZLIB_STREAM, compressor)
+        else:
+            parts = Protocol.create_video_delta(frame_bytes, previous, CODEC_ZLIB_STREAM, compressor)
+        messages.append(b''.join(parts))
+        previous = frame_bytes
+    return messages
+
+
+def test_streamed_frames_share_history():
+    """Stream-compressed deltas should decode in order and shrink repeats."""
+    conn, peer = _connected_pair()
+    try:
+        base = "@@##**++::  \n" * 40
+        frames = [base, base.replace("@", "%"), base, base.replace("@", "%"), base]
+        messages = _stream_video_messages(frames, keyframes={0})
+        for msg in messages:
+            peer.sendall(msg)
+        
+        for frame in frames:
+            assert conn.get_video_frame(timeout=2) == frame
+        # The third delta repeats the first one, found in the stream's history
+        assert len(messages[3]) < len(messages[1])
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_stream_resyncs_after_corrupted_video():
+    """After a dropped stream-coded message, frames should decode again from the next keyframe."""
+    conn, peer = _connected_pair()
+    try:
+        base = "@@##**++::  \n" * 40
+        frames = [base.replace("@", c) for c in "@%#@%#@"]
+        messages = _stream_video_messages(frames, keyframes={0, 4})
+        corrupted = bytearray(messages[2])
+        corrupted[-1] ^= 0x01
+        messages[2] = bytes(corrupted)
+        for msg in messages:
+            peer.sendall(msg)
+        
+        # Frame 3 is a delta against the lost frame and is skipped
+        for i in (0, 1, 4, 5, 6):
+            assert conn.get_video_frame(timeout=2) == frames[i]
+        assert conn.get_video_frame(timeout=0.2) is None
+    finally:
+        conn.close()
+        peer.close()
+
+
+def test_video_deltas_between_connections():
+    """Frames sent as deltas should arrive unchanged, with periodic keyframes."""
+    a, b = socket.socketpair()
+    sender = NetworkConnection(sock=a)
+    receiver = NetworkConnection(sock=b)
+    sender.start_as_accepted()
+    receiver.start_as_accepted()
+    try:
+        sender.keyframe_interval = 3
+        base = "@@##**++::  \n" * 40
+        frames = [base, base.replace("@", "%", 2), base.replace("#", "*"), base + "extra\n",
+                  base, base.replace(":", ".", 5), base.replace("+", "="), base]
+        for frame in frames:
+            assert sender.send_video_frame(frame)
+            assert receiver.get_video_frame(timeout=2) == frame
+        assert sender._deltas_since_keyframe == 3
+    finally:
+        sender.close()
+        receiver.close()
+
+
+def test_battleship_payload_round_trip():
+    """Battleship messages should decode to what was sent."""
+    def payload(msg):
+        return msg[HEADER_SIZE:]
+    
+    for accepted in (True, False):
+        assert Protocol.parse_battleship_accept(payload(Protocol.create_battleship_accept(accepted))) is accepted
+    
+    assert Protocol.parse_battleship_move(payload(Protocol.create_battleship_move("C7"))) == "C7"
+    assert Protocol.parse_battleship_move(payload(Protocol.create_battleship_move(" j10"))) == "J10"
+    assert Protocol.parse_battleship_move(payload(Protocol.create_battleship_dice_roll(17))) == "17"
+    
+    for result, ship_name in (("miss", None), ("hit", None), ("sunk", "Battleship")):
+        msg = Protocol.create_battleship_result(result, ship_name)
+        assert Protocol.parse_battleship_result(payload(msg)) == (result, ship_name)
+    
+    ships = [(0, 0, 5, True), (4, 9, 2, False)]
+    assert Protocol.parse_battleship_ship_placement(payload(Protocol.create_battleship_ship_placement(ships))) == ships
+    assert Protocol.parse_battleship_ship_placement(payload(Protocol.create_battleship_ship_placement([]))) == []
+
+
+if __name__ == "__main__":
+    test_messages_split_across_segments()
+    test_message_larger_than_receive_buffer()
+    test_corrupted_message_dropped()
+    test_heartbeats_and_timeouts()
+    test_peer_close_detected()
+    test_messages_routed_to_their_queues()
+    test_get_next_waits_on_all_queues()
+    test_video_queue_keeps_most_recent_frames()
+    test_queued_video_frames_coalesce()
+    test_send_parts_delivers_one_message()
+    test_video_codec_negotiation()
+    test_streamed_frames_share_history()
+    test_stream_resyncs_after_corrupted_video()
+    test_video_deltas_between_connections()
+    test_battleship_payload_round_trip()
+    print("✓ All network tests passed!")
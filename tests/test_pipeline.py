@@ -21,6 +21,7 @@ def test_ascii_video():
     time.sleep(2)
     
     converter = AsciiConverter(width=100, char_set="simple")
+    clear_screen()
     
     try:
         with VideoCapture(device_id=0, fps_target=15) as cap:
@@ -34,12 +35,8 @@ def test_ascii_video():
                     time.sleep(0.01)  # Small delay to avoid busy waiting
                     continue
                 
-                # Convert to ASCII
-                ascii_art = converter.image_to_ascii(frame)
-                
-                # Clear screen and display
-                clear_screen()
-                print(ascii_art)
+                # Convert to ASCII and draw over the previous frame
+                converter.image_to_ascii_to_stdout(frame)
                 
                 # Show stats
                 frame_count += 1
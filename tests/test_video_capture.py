@@ -0,0 +1,83 @@
+"""
+Test the background camera reader with a stand-in camera
+"""
+import threading
+import time
+import numpy as np
+from video_capture import VideoCapture
+
+
+class FakeCamera:
+    """Produces numbered frames at a fixed rate, like cv2.VideoCapture.read()."""
+
+    def __init__(self, fps=60):
+        self.delay = 1.0 / fps
+        self.count = 0
+        self.released = False
+        self.reading = threading.Lock()
+
+    def read(self):
+        with self.reading:
+            time.sleep(self.delay)
+            self.count += 1
+            return True, np.full((4, 4, 3), self.count % 256, dtype=np.uint8)
+
+    def release(self):
+        # Releasing while another thread is inside read() must not happen
+        assert self.reading.acquire(blocking=False)
+        self.reading.release()
+        self.released = True
+
+
+def _open_capture(fps_target):
+    capture = VideoCapture(fps_target=fps_target)
+    capture.cap = FakeCamera()
+    capture.is_open = True
+    return capture
+
+
+def test_reader_returns_newest_frames():
+    """read_latest should hand out fresh frames without repeats."""
+    capture = _open_capture(fps_target=30)
+    capture.start_reader()
+    try:
+        seen = []
+        for _ in range(5):
+            frame = capture.read_latest(timeout=1)
+            assert frame is not None
+            seen.append(int(frame[0, 0, 0]))
+        assert seen == sorted(set(seen))
+    finally:
+        capture.close()
+    assert capture.cap.released
+
+
+def test_reader_keeps_fps_target():
+    """The reader should publish about fps_target frames per second."""
+    capture = _open_capture(fps_target=10)
+    capture.start_reader()
+    try:
+        frames = 0
+        deadline = time.time() + 1.0
+        while time.time() < deadline:
+            if capture.read_latest(timeout=0.1) is not None:
+                frames += 1
+        assert 5 <= frames <= 12
+    finally:
+        capture.close()
+
+
+def test_read_latest_times_out_when_closed():
+    """Nothing should be returned once the capture is closed."""
+    capture = _open_capture(fps_target=30)
+    capture.start_reader()
+    capture.close()
+    capture.read_latest(timeout=0)  # Drop a frame published before closing
+    assert capture.read_latest(timeout=0.2) is None
+
+
+if __name__ == "__main__":
+    test_reader_returns_newest_frames()
+    test_reader_keeps_fps_target()
+    test_read_latest_times_out_when_closed()
+    print("✓ All video capture tests passed!")
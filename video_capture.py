@@ -2,7 +2,9 @@
 Video Capture - Webcam capture wrapper using OpenCV
 """
 import cv2
+import threading
 import time
+from collections import deque
 
 
 class VideoCapture:
@@ -23,6 +25,11 @@ class VideoCapture:
         self.is_open = False
         self.last_frame_time = 0
         
+        # Background reader (see start_reader): only the newest frame is kept
+        self._latest = deque(maxlen=1)
+        self._frame_ready = threading.Event()
+        self._reader = None
+        
     def open(self):
         """Open the video capture device."""
         # Try DirectShow backend on Windows for better compatibility
@@ -43,6 +50,7 @@ class VideoCapture:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         self.cap.set(cv2.CAP_PROP_FPS, self.fps_target)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Always read the newest frame
         
         self.is_open = True
         
@@ -89,11 +97,65 @@ class VideoCapture:
         
         return frame
     
+    def start_reader(self):
+        """
+        Read frames on a background thread, so waiting for the camera
+        overlaps with processing the previous frame. Get frames with
+        read_latest() afterwards.
+        """
+        if self._reader is None and self.is_open:
+            self._reader = threading.Thread(target=self._read_loop, daemon=True)
+            self._reader.start()
+    
+    def _read_loop(self):
+        """Reader thread: publish the newest frame at the FPS target."""
+        while self.is_open:
+            wait = self.frame_delay - (time.time() - self.last_frame_time)
+            if wait > 0:
+                time.sleep(wait)
+                continue
+            
+            frame = self.read_frame_throttled()
+            if frame is None:
+                time.sleep(0.01)  # Read failed, don't spin
+                continue
+            
+            # Replaces a frame nobody picked up yet
+            self._latest.append(frame)
+            self._frame_ready.set()
+    
+    def read_latest(self, timeout=0.1):
+        """
+        Get the newest frame from the reader thread, waiting for one if needed.
+        
+        Returns:
+            numpy array (BGR format) or None on timeout
+        """
+        try:
+            return self._latest.popleft()
+        except IndexError:
+            pass
+        
+        # Clear before re-checking so a frame published in between still wakes us
+        self._frame_ready.clear()
+        if not self._latest:
+            self._frame_ready.wait(timeout)
+        
+        try:
+            return self._latest.popleft()
+        except IndexError:
+            return None
+    
     def close(self):
         """Release the video capture device."""
+        self.is_open = False
+        self._frame_ready.set()
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join(timeout=1)  # Don't release while it's mid-read
+        self._reader = None
+        
         if self.cap is not None:
             self.cap.release()
-            self.is_open = False
     
     def __enter__(self):
         """Context manager entry."""
@@ -105,6 +167,52 @@ class VideoCapture:
         self.close()
 
 
+# Cameras opened in the background by prewarm(), keyed by device ID
+_prewarm_threads = {}
+_prewarmed = {}
+
+
+def prewarm(device_id=0, fps_target=15):
+    """
+    Start opening a camera in a background thread.
+    
+    Opening a camera can take seconds; call this early and collect the
+    result with take_prewarmed().
+    
+    Args:
+        device_id: Camera device ID
+        fps_target: Target frames per second
+    """
+    def _open():
+        capture = VideoCapture(device_id=device_id, fps_target=fps_target)
+        try:
+            capture.open()
+        except Exception:
+            return  # The caller opens the camera again and reports the error
+        _prewarmed[device_id] = capture
+    
+    thread = threading.Thread(target=_open, daemon=True)
+    _prewarm_threads[device_id] = thread
+    thread.start()
+
+
+def take_prewarmed(device_id=0):
+    """
+    Get the camera opened by prewarm(), waiting for it to finish.
+    
+    Args:
+        device_id: Camera device ID
+        
+    Returns:
+        Opened VideoCapture, or None if it wasn't prewarmed or failed to open
+    """
+    thread = _prewarm_threads.pop(device_id, None)
+    if thread is None:
+        return None
+    thread.join()
+    return _prewarmed.pop(device_id, None)
+
+
 if __name__ == "__main__":
     # Test video capture
     print("Testing Video Capture...")